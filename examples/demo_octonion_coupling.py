@@ -1,8 +1,9 @@
 
 import numpy as np
-from a003558.coupling import coupled_step
+from a003558.coupling import coupled_sweep
 
-for k1 in range(2,7):
-    for k2 in range(2,7):
-        err = coupled_step(k1,k2)
-        print(f"k_brain={k1:2d}, k_cosmos={k2:2d} -> norm error ~ {err:.2e}")
+ks = np.arange(2,7)
+errs = coupled_sweep(ks, ks)
+for i, k1 in enumerate(ks):
+    for j, k2 in enumerate(ks):
+        print(f"k_brain={k1:2d}, k_cosmos={k2:2d} -> norm error ~ {errs[i, j]:.2e}")
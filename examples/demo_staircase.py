@@ -1,11 +1,11 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
-from a003558.number_theory import multiplicative_order
+from a003558.batch import back_front_range
 
 N=1024
 n_vals = np.arange(1,N+1)
-L_vals = np.array([ multiplicative_order(2, 2*n-1) for n in n_vals ])
+L_vals = back_front_range(1, N+1)
 
 plt.figure(figsize=(9,5))
 plt.scatter(n_vals, L_vals, s=6, alpha=0.5)
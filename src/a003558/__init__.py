@@ -1,9 +1,14 @@
-from importlib.metadata import version, PackageNotFoundError
-
-try:
-    __version__ = version("a003558")
-except PackageNotFoundError:
-    __version__ = "0"
+def __getattr__(name):
+    # __version__ lui opgezocht: importlib.metadata kost ~60 ms bij import
+    if name == "__version__":
+        from importlib.metadata import version, PackageNotFoundError
+        try:
+            value = version("a003558")
+        except PackageNotFoundError:
+            value = "0"
+        globals()["__version__"] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Viz niet auto-importeren (vereist matplotlib):
 # from a003558.viz import plot_basis  # gebruikers doen dit expliciet
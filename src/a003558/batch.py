@@ -0,0 +1,173 @@
+"""
+Vectorized batch engine for A003558 over whole n-ranges.
+
+One smallest-prime-factor (SPF) sieve is built up to the largest modulus;
+every factorization of m = 2n±1 and of the Carmichael function λ(m) is then
+read from that table.  The order ord_m(2) follows from λ(m) by stripping
+prime factors q while 2^(t/q) ≡ 1 (mod m), done for all m at once with
+vectorized modular exponentiation in uint64.
+
+Moduli must stay below 2^32 so that products of two residues fit in uint64.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+_MAX_MODULUS = 1 << 32
+_CHUNK = 1 << 16
+
+_spf_cache: np.ndarray | None = None
+
+
+def spf_sieve(limit: int) -> np.ndarray:
+    """
+    Smallest prime factor table spf[0..limit] (spf[0] = spf[1] = 0).
+    """
+    if limit < 0:
+        raise ValueError("limit must be >= 0")
+    dtype = np.int32 if limit < (1 << 31) else np.int64
+    spf = np.zeros(limit + 1, dtype=dtype)
+    if limit >= 2:
+        spf[2::2] = 2
+    p = 3
+    while p * p <= limit:
+        if spf[p] == 0:
+            block = spf[p * p::2 * p]
+            block[block == 0] = p
+        p += 2
+    rest = spf == 0
+    rest[:2] = False
+    spf[rest] = np.flatnonzero(rest)
+    return spf
+
+
+def _spf_upto(limit: int) -> np.ndarray:
+    """Module-level SPF table, rebuilt only when a larger limit is needed."""
+    global _spf_cache
+    if _spf_cache is None or len(_spf_cache) <= limit:
+        _spf_cache = spf_sieve(max(limit, 1 << 16))
+    return _spf_cache
+
+
+def _powmod(base: np.ndarray, exp: np.ndarray, mod: np.ndarray) -> np.ndarray:
+    """Elementwise base^exp mod mod for uint64 arrays with mod < 2^32."""
+    one = np.uint64(1)
+    result = np.ones_like(mod)
+    base = base % mod
+    exp = exp.copy()
+    while True:
+        result = result * np.where(exp & one, base, one) % mod
+        exp >>= one
+        if not exp.any():
+            break
+        base = base * base % mod
+    return result
+
+
+def _reduce_order(m: np.ndarray, t: np.ndarray, rounds) -> np.ndarray:
+    """
+    Reduce a multiple t of ord_m(2) to the order itself.
+
+    `rounds` yields (idx, q, qe) triples: for each element idx, q is a prime
+    dividing t exactly as q^e = qe.  An element appears at most once per round.
+    """
+    t = t.copy()
+    for idx, q, qe in rounds:
+        if len(idx) == 0:
+            continue
+        mi = m[idx]
+        tr = t[idx] // qe
+        g = _powmod(np.full(len(idx), 2, dtype=np.uint64), tr, mi)
+        todo = np.flatnonzero(g != 1)
+        while len(todo):
+            g[todo] = _powmod(g[todo], q[todo], mi[todo])
+            tr[todo] *= q[todo]
+            todo = todo[g[todo] != 1]
+        t[idx] = tr
+    return t
+
+
+def _spf_rounds(t: np.ndarray, spf: np.ndarray):
+    """Split each t into its prime powers, one distinct prime per round."""
+    rest = t.copy()
+    idx = np.flatnonzero(rest > 1)
+    while len(idx):
+        q = spf[rest[idx]].astype(np.uint64)
+        qe = np.ones_like(q)
+        div = np.arange(len(idx))
+        while len(div):
+            rest[idx[div]] //= q[div]
+            qe[div] *= q[div]
+            div = div[rest[idx[div]] % q[div] == 0]
+        yield idx, q, qe
+        idx = idx[rest[idx] > 1]
+
+
+def _carmichael_spf(m: np.ndarray, spf: np.ndarray) -> np.ndarray:
+    """λ(m) for odd m via the SPF table: lcm over p^e of (p-1)·p^(e-1)."""
+    lam = np.ones_like(m)
+    rest = m.copy()
+    idx = np.flatnonzero(rest > 1)
+    while len(idx):
+        p = spf[rest[idx]].astype(np.uint64)
+        part = p - 1
+        rest[idx] //= p
+        div = np.flatnonzero(rest[idx] % p == 0)
+        while len(div):
+            rest[idx[div]] //= p[div]
+            part[div] *= p[div]
+            div = div[rest[idx[div]] % p[div] == 0]
+        lam[idx] = np.lcm(lam[idx], part)
+        idx = idx[rest[idx] > 1]
+    return lam
+
+
+def orders_of_two(ms, spf: np.ndarray | None = None) -> np.ndarray:
+    """
+    ord_m(2) for an array of odd moduli m >= 1 (ord_1(2) = 1).
+
+    `spf` may be a precomputed table from `spf_sieve` covering max(m).
+    """
+    m = np.asarray(ms, dtype=np.uint64).ravel()
+    if len(m) == 0:
+        return np.zeros(0, dtype=np.int64)
+    if np.any(m % 2 == 0):
+        raise ValueError("moduli must be odd")
+    top = int(m.max())
+    if top >= _MAX_MODULUS:
+        raise ValueError("moduli must be < 2^32 for the batch engine")
+    if spf is None:
+        spf = _spf_upto(top)
+    elif len(spf) <= top:
+        raise ValueError("spf table does not cover the largest modulus")
+    out = np.ones(len(m), dtype=np.int64)
+    for lo in range(0, len(m), _CHUNK):
+        mc = m[lo:lo + _CHUNK]
+        lam = _carmichael_spf(mc, spf)
+        out[lo:lo + _CHUNK] = _reduce_order(mc, lam, _spf_rounds(lam, spf))
+    return out
+
+
+def a003558_range(start: int, stop: int, spf: np.ndarray | None = None) -> np.ndarray:
+    """
+    A003558(n) = ord_{2n+1}(2) for n in [start, stop), as an int64 array.
+    """
+    if start < 0:
+        raise ValueError("n >= 0 required")
+    if stop <= start:
+        return np.zeros(0, dtype=np.int64)
+    m = 2 * np.arange(start, stop, dtype=np.uint64) + 1
+    return orders_of_two(m, spf=spf)
+
+
+def back_front_range(start: int, stop: int, spf: np.ndarray | None = None) -> np.ndarray:
+    """
+    Back-front cycle lengths ord_{2n-1}(2) for n in [start, stop), int64 array.
+    """
+    if start <= 0:
+        raise ValueError("n must be >=1")
+    if stop <= start:
+        return np.zeros(0, dtype=np.int64)
+    m = 2 * np.arange(start, stop, dtype=np.uint64) - 1
+    return orders_of_two(m, spf=spf)
@@ -2,6 +2,8 @@
 from __future__ import annotations
 import numpy as np
 
+from .horizons import bit_length_array
+
 def quenneau_spin_to_dyadic_capacity(pattern: np.ndarray) -> int:
     """
     Toy: given a 'spin' pattern (0/1) length N, return dyadic capacity 2^k >= N
@@ -19,3 +21,61 @@ def compression_loss(pattern: np.ndarray) -> float:
     N = len(pattern)
     capacity = quenneau_spin_to_dyadic_capacity(pattern)
     return (capacity - N) / capacity
+
+# ---------- Batch API on bit-packed ragged collections ----------
+
+_POPCOUNT8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.int64)
+
+def pack_patterns(patterns) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Pack a ragged collection of 0/1 patterns into (np.packbits bytes, bit offsets).
+
+    offsets has length len(patterns)+1; pattern i occupies bits
+    offsets[i]:offsets[i+1] of the packed stream (big-endian bit order).
+    """
+    lengths = np.array([len(p) for p in patterns], dtype=np.int64)
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    bits = np.concatenate([np.asarray(p, dtype=bool).ravel() for p in patterns]) \
+        if len(patterns) else np.zeros(0, dtype=bool)
+    return np.packbits(bits), offsets
+
+def dyadic_capacity_array(lengths: np.ndarray) -> np.ndarray:
+    """Vectorized quenneau_spin_to_dyadic_capacity on pattern lengths (int64)."""
+    n = np.maximum(np.asarray(lengths, dtype=np.int64), 1)
+    return np.left_shift(1, bit_length_array(n - 1))
+
+def spin_batch_stats(packed: np.ndarray, offsets: np.ndarray) -> dict[str, np.ndarray]:
+    """
+    Capacity, loss, popcount and dyadic-block occupancy for many patterns at once.
+
+    Works on the packed bytes directly: popcounts come from a byte lookup
+    table with a prefix sum, partial bytes at pattern edges are masked.
+    Returns arrays keyed "length", "capacity", "loss", "popcount" and
+    "occupancy" (popcount / capacity: share of the dyadic block set to 1).
+    """
+    packed = np.asarray(packed, dtype=np.uint8)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    if offsets.ndim != 1 or len(offsets) == 0 or np.any(np.diff(offsets) < 0):
+        raise ValueError("offsets must be a non-decreasing 1D array")
+    if offsets[-1] > 8 * len(packed):
+        raise ValueError("offsets exceed the packed bit stream")
+    data = np.append(packed, np.uint8(0))
+    cum = np.zeros(len(data) + 1, dtype=np.int64)
+    np.cumsum(_POPCOUNT8[data], out=cum[1:])
+
+    byte = offsets >> 3
+    rem = offsets & 7
+    head = (0xFF00 >> rem) & 0xFF  # bovenste `rem` bits van de laatste byte
+    ones_before = cum[byte] + _POPCOUNT8[data[byte] & head]
+
+    lengths = np.diff(offsets)
+    capacity = dyadic_capacity_array(lengths)
+    popcount = np.diff(ones_before)
+    return {
+        "length": lengths,
+        "capacity": capacity,
+        "loss": (capacity - lengths) / capacity,
+        "popcount": popcount,
+        "occupancy": popcount / capacity,
+    }
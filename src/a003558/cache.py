@@ -0,0 +1,130 @@
+"""
+Opt-in, bounded memoization layer for the number_theory entry points.
+
+Caching is off by default.  `enable()` creates one shared cache per name:
+
+- "factors":              factorizations, shared by phi, prime_power_factors
+                          and the exponent factoring in multiplicative_order
+- "multiplicative_order": ord_m(a) keyed by (a, m)
+- "a003558_order":        A003558(n) keyed by n
+
+Every cache is thread-safe, bounded (`maxsize`), evicts by "lru" or "fifo"
+policy, and counts hits and misses.  `clear()` empties them (and any
+registered clear hooks, such as the prime-power order cache).
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+NAMES = ("factors", "multiplicative_order", "a003558_order")
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Thread-safe bounded mapping with LRU or FIFO eviction and hit/miss counters."""
+
+    def __init__(self, maxsize: int = 4096, policy: str = "lru"):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        if policy not in ("lru", "fifo"):
+            raise ValueError("policy must be 'lru' or 'fifo'")
+        self.maxsize = maxsize
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default=_MISSING):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            if self.policy == "lru":
+                self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value) -> None:
+        with self._lock:
+            if key in self._data:
+                if self.policy == "lru":
+                    self._data.move_to_end(key)
+            elif len(self._data) >= self.maxsize:
+                self._data.popitem(last=False)
+            self._data[key] = value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def info(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._data),
+                "maxsize": self.maxsize, "policy": self.policy}
+
+
+_caches: dict[str, LRUCache] = {}
+_clear_hooks: list[Callable[[], None]] = []
+
+
+def enable(maxsize: int = 4096, policy: str = "lru", names=NAMES) -> None:
+    """Turn caching on (fresh caches) for the given entry points."""
+    for name in names:
+        if name not in NAMES:
+            raise ValueError(f"unknown cache {name!r}; choose from {NAMES}")
+        _caches[name] = LRUCache(maxsize, policy)
+
+
+def disable() -> None:
+    """Turn all caches off and drop their contents."""
+    _caches.clear()
+
+
+def get_cache(name: str) -> LRUCache | None:
+    """The active cache for `name`, or None when caching is off."""
+    return _caches.get(name)
+
+
+def cached(name: str, key: Hashable, compute: Callable[[], object]):
+    """Look `key` up in cache `name`, computing and storing it on a miss."""
+    cache = _caches.get(name)
+    if cache is None:
+        return compute()
+    value = cache.get(key)
+    if value is _MISSING:
+        value = compute()
+        cache.put(key, value)
+    return value
+
+
+def register_clear_hook(fn: Callable[[], None]) -> None:
+    """Also call `fn` whenever clear() runs (e.g. an lru_cache.cache_clear)."""
+    _clear_hooks.append(fn)
+
+
+def clear(name: str | None = None) -> None:
+    """Empty one cache, or all caches plus the registered hooks."""
+    if name is not None:
+        if name in _caches:
+            _caches[name].clear()
+        return
+    for cache in _caches.values():
+        cache.clear()
+    for fn in _clear_hooks:
+        fn()
+
+
+def stats() -> dict[str, dict]:
+    """Hit/miss/size counters per active cache."""
+    return {name: cache.info() for name, cache in _caches.items()}
@@ -0,0 +1,187 @@
+"""
+Command-line interface: bulk sequence generation to files or stdout.
+
+    a003558 range 0 1000000 --format npy -o a.npy --workers 8 --progress
+    a003558 range 1 5000 --kind back_front            # CSV to stdout
+    a003558 spikes 1 100000 --format bin -o spikes.bin
+    a003558 verify-horizon 100000000 --chunk 1048576
+
+Only argparse is imported at start-up; NumPy and the compute modules are
+imported inside the subcommand that needs them, so `a003558 --help` stays fast.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+FORMATS = ("csv", "npy", "bin")
+
+
+class _Progress:
+    def __init__(self, total: int, enabled: bool):
+        self.total = max(total, 1)
+        self.done = 0
+        self.enabled = enabled
+
+    def step(self, k: int) -> None:
+        self.done += k
+        if self.enabled:
+            sys.stderr.write(f"\r{self.done}/{self.total} ({100 * self.done // self.total}%)")
+            sys.stderr.flush()
+
+    def finish(self) -> None:
+        if self.enabled:
+            sys.stderr.write("\n")
+
+
+def _open_out(path: str | None):
+    if path is None or path == "-":
+        return sys.stdout.buffer, False
+    return open(path, "wb", buffering=1 << 20), True
+
+
+def _write_block(f, fmt: str, cols) -> None:
+    """Write one block of equally long int64 columns (CSV rows, or raw row-major)."""
+    import numpy as np
+
+    block = np.column_stack(cols).astype("<i8")
+    if fmt == "csv":
+        if len(block):
+            lines = "\n".join(",".join(map(str, row)) for row in block.tolist())
+            f.write(lines.encode() + b"\n")
+    else:
+        f.write(block.tobytes())
+
+
+def _cmd_range(args) -> int:
+    import numpy as np
+
+    if args.kind == "a003558":
+        from .batch import a003558_range as fn
+    else:
+        from .batch import back_front_range as fn
+    total = max(0, args.stop - args.start)
+    progress = _Progress(total, args.progress)
+    f, close = _open_out(args.output)
+    try:
+        if args.format == "csv" and args.header:
+            f.write(b"n,value\n")
+        if args.format == "npy":
+            np.lib.format.write_array_header_1_0(
+                f, {"descr": "<i8", "fortran_order": False, "shape": (total,)})
+        if args.workers == 1:
+            blocks = ((lo, fn(lo, min(args.stop, lo + args.chunk)))
+                      for lo in range(args.start, args.stop, args.chunk))
+        else:
+            # One sieve and one process pool for the whole range.
+            from .parallel import iter_parallel_range
+            blocks = iter_parallel_range(args.start, args.stop, kind=args.kind,
+                                         workers=args.workers, chunk=args.chunk)
+        for lo, vals in blocks:
+            hi = lo + len(vals)
+            if args.format == "csv":
+                _write_block(f, "csv", [np.arange(lo, hi), vals])
+            else:
+                f.write(vals.astype("<i8").tobytes())
+            progress.step(hi - lo)
+    finally:
+        progress.finish()
+        if close:
+            f.close()
+        else:
+            f.flush()
+    return 0
+
+
+def _cmd_spikes(args) -> int:
+    import numpy as np
+
+    from .cosmos import prime_power_spike_array
+
+    total = max(0, args.stop - args.start)
+    progress = _Progress(total, args.progress)
+    f, close = _open_out(args.output)
+    found = []
+    try:
+        if args.format == "csv" and args.header:
+            f.write(b"n,m,p,e\n")
+        for lo in range(args.start, args.stop, args.chunk):
+            hi = min(args.stop, lo + args.chunk)
+            n = np.arange(lo, hi, dtype=np.int64)
+            m = 2 * n - 1
+            mask, p, e = prime_power_spike_array(m, return_parts=True)
+            cols = [n[mask], m[mask], p[mask], e[mask]]
+            if args.format == "npy":
+                found.append(np.column_stack(cols))
+            else:
+                _write_block(f, args.format, cols)
+            progress.step(hi - lo)
+        if args.format == "npy":
+            out = np.concatenate(found) if found else np.zeros((0, 4), dtype=np.int64)
+            np.save(f, out.astype("<i8"))
+    finally:
+        progress.finish()
+        if close:
+            f.close()
+        else:
+            f.flush()
+    return 0
+
+
+def _cmd_verify_horizon(args) -> int:
+    from .horizons import verify_horizon
+
+    checked, failure = verify_horizon(args.stop, start=args.start, chunk=args.chunk)
+    if failure is None:
+        print(f"horizon bound holds for n in [{args.start}, {args.stop}) ({checked} values)")
+        return 0
+    print(f"horizon bound fails at n={failure} (after {checked} values)")
+    return 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="a003558", description="A003558 bulk generation")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def common(p, chunk=1 << 20):
+        p.add_argument("-o", "--output", default=None, help="output file (default: stdout)")
+        p.add_argument("--format", choices=FORMATS, default="csv")
+        p.add_argument("--no-header", dest="header", action="store_false",
+                       help="omit the CSV header line")
+        p.add_argument("--chunk", type=int, default=chunk, help="n values per block")
+        p.add_argument("--progress", action="store_true", help="progress on stderr")
+
+    p = sub.add_parser("range", help="A003558 / back-front values for n in [start, stop)")
+    p.add_argument("start", type=int)
+    p.add_argument("stop", type=int)
+    p.add_argument("--kind", choices=("a003558", "back_front"), default="a003558")
+    p.add_argument("--workers", type=int, default=1, help="processes (0 = all cores)")
+    common(p)
+    p.set_defaults(func=_cmd_range)
+
+    p = sub.add_parser("spikes", help="n in [start, stop) where 2n-1 is an odd prime power")
+    p.add_argument("start", type=int)
+    p.add_argument("stop", type=int)
+    common(p)
+    p.set_defaults(func=_cmd_spikes)
+
+    p = sub.add_parser("verify-horizon", help="check L >= 1 + ceil(log2 n) on [start, stop)")
+    p.add_argument("stop", type=int)
+    p.add_argument("--start", type=int, default=1)
+    p.add_argument("--chunk", type=int, default=1 << 20)
+    p.set_defaults(func=_cmd_verify_horizon)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    if getattr(args, "chunk", 1) <= 0:
+        raise SystemExit("--chunk must be positive")
+    if getattr(args, "workers", 1) == 0:
+        args.workers = None
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
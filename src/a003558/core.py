@@ -1,5 +1,91 @@
-def a003558_term(n: int) -> int:
+from __future__ import annotations
+
+import operator
+
+import numpy as np
+
+from . import number_theory
+from .batch import _MAX_MODULUS, orders_of_two
+
+# Onder deze grootte is de scalaire (gecachete) weg sneller dan een zeef.
+_BATCH_MIN = 64
+# Vanaf hier past ord_{2n±1}(2) <= 2n niet gegarandeerd in int64: scalaire weg.
+_WIDE = 1 << 62
+
+
+# kind -> (m = 2n + offset, kleinste n, scalaire functie)
+_KINDS = {
+    "a003558": (1, 0, number_theory.a003558_order),
+    "back_front": (-1, 1, number_theory.back_front_cycle_length),
+}
+
+
+def _terms(kind: str, n):
+    """Gedeelde dispatch voor a003558_term en back_front_term."""
+    offset, first, scalar = _KINDS[kind]
+    if np.ndim(n) == 0:
+        # operator.index weigert floats (7.9 werd anders stil 7), net als de arrayweg
+        return scalar(operator.index(n))
+    arr = np.asarray(n)
+    if arr.dtype == object:
+        py = [operator.index(x) for x in arr.ravel().tolist()]
+        if py and min(py) < first:
+            raise ValueError(f"n >= {first} required")
+        wide = np.array([x >= _WIDE for x in py], dtype=bool)
+        flat = np.array([0 if w else x for x, w in zip(py, wide)], dtype=np.int64)
+    elif arr.size and not np.issubdtype(arr.dtype, np.integer):
+        raise TypeError("n must contain integers")
+    else:
+        raw = arr.ravel()
+        wide = raw >= _WIDE
+        py = raw.tolist() if wide.any() else []
+        flat = np.where(wide, 0, raw).astype(np.int64)
+    if flat.size and flat[~wide].min(initial=first) < first:
+        raise ValueError(f"n >= {first} required")
+    out = np.empty(flat.size, dtype=np.int64)
+    todo = np.flatnonzero(~wide)
+
+    table = number_theory._TABLES.get(kind)
+    if table is not None and len(table):
+        ns = flat[todo]
+        hit = (ns >= table.start) & (ns < table.stop)
+        out[todo[hit]] = table.values[ns[hit] - table.start]
+        todo = todo[~hit]
+
+    if len(todo):
+        ns = flat[todo]
+        top = 2 * int(ns.max()) + offset
+        dense = top <= 64 * len(ns) + (1 << 20)
+        if len(ns) >= _BATCH_MIN and dense and top < _MAX_MODULUS:
+            m = 2 * ns.astype(np.uint64)
+            out[todo] = orders_of_two(m + np.uint64(1) if offset > 0 else m - np.uint64(1))
+        else:
+            out[todo] = [scalar(int(x)) for x in ns]
+    if wide.any():
+        # Termen kunnen voorbij int64 gaan: object-array met Python-ints.
+        out = out.astype(object)
+        out[wide] = [scalar(py[i]) for i in np.flatnonzero(wide).tolist()]
+    return out.reshape(arr.shape)
+
+
+def a003558_term(n):
     """
-    Placeholder implementatie; vervang door echte definitie.
+    A003558(n) = ord_{2n+1}(2), publiek snel toegangspunt.
+
+    Een scalaire n geeft een int (via `number_theory.a003558_order`, met
+    gekoppelde tabel en CRT-cache).  Een array-achtige n geeft een int64-array
+    met dezelfde vorm: waarden uit een gekoppelde tabel (`table.attach`) worden
+    direct gelezen, de rest gaat naar de zeef-batchengine wanneer de invoer
+    groot en dicht genoeg is, anders per element naar de scalaire weg.
+    Object-arrays met Python-ints en uint64-waarden vanaf 2^62 gaan per element
+    naar de scalaire weg; dan is het resultaat een object-array.
     """
-    return n
+    return _terms("a003558", n)
+
+
+def back_front_term(n):
+    """
+    Back-front cycluslengte ord_{2n-1}(2) (n >= 1), met dezelfde dispatch als
+    `a003558_term`: scalair of array, tabel, zeef of scalaire weg.
+    """
+    return _terms("back_front", n)
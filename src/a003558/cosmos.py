@@ -1,6 +1,15 @@
 
 from __future__ import annotations
 
+import numpy as np
+
+from .batch import _spf_upto
+from .factorization import factorint
+
+# Largest m served by the (process-wide, cached) SPF sieve: 2^27 int32 = 512 MB.
+# Larger entries go through factorint one by one.
+_SIEVE_LIMIT = 1 << 27
+
 def dyadic_horizon_crossed(n: int, L: int) -> bool:
     """
     Phase trigger: 'universe scale' 2^n crosses critical 2^L.
@@ -11,20 +20,59 @@ def prime_power_spike(m: int) -> bool:
     """
     Heuristic tag: True if m is p^k for odd prime p.
     """
-    x = m
-    p = None
-    d = 2
-    found = False
-    while d * d <= x:
-        e = 0
-        while x % d == 0:
-            x //= d; e += 1
-        if e:
-            if p is None: p = d
-            else: return False
-            found = True
-        d = 3 if d == 2 else d + 2
-    if x > 1:
-        if p is None: p = x; found = True
-        else: return False
-    return found and (p % 2 == 1)
+    if m < 2:
+        return False
+    fac = factorint(m)
+    return len(fac) == 1 and next(iter(fac)) % 2 == 1
+
+def prime_power_spike_array(ms: np.ndarray, return_parts: bool = False,
+                            sieve_limit: int = _SIEVE_LIMIT):
+    """
+    Vectorized prime_power_spike over an integer array.
+
+    Uses one smallest-prime-factor sieve up to the largest entry, capped at
+    `sieve_limit`; entries above the cap are factored individually with
+    factorint, so a single huge m cannot blow up memory.  Primes are caught by
+    m // spf[m] == 1; repeated division only runs on the few entries where
+    spf[m]^2 divides m.  With
+    return_parts=True also returns (base, exponent) arrays, which are 0
+    where the entry is not an odd prime power (base is uint64 for uint64 input).
+    """
+    m = np.asarray(ms)
+    if m.size and not np.issubdtype(m.dtype, np.integer):
+        raise TypeError("ms must contain integers")
+    # No cast before the split: uint64 entries >= 2^63 would wrap to negative.
+    flat = m.ravel()
+    mask = np.zeros(flat.size, dtype=bool)
+    base = np.zeros(flat.size, dtype=np.uint64 if m.dtype == np.uint64 else np.int64)
+    exp = np.zeros(flat.size, dtype=np.int64)
+    big = np.flatnonzero(flat > sieve_limit)
+    for i in big.tolist():
+        fac = factorint(int(flat[i]))
+        if len(fac) == 1:
+            (pb, eb), = fac.items()
+            if pb % 2 == 1:
+                mask[i], base[i], exp[i] = True, pb, eb
+    idx = np.flatnonzero((flat >= 3) & (flat <= sieve_limit))
+    if len(idx):
+        vals = flat[idx].astype(np.int64)
+        spf = _spf_upto(int(vals.max()))
+        p = spf[vals].astype(np.int64)
+        q = vals // p
+        # only entries with p^2 | m need repeated division; primes have q == 1
+        keep = (p != 2) & ((q == 1) | (spf[q] == p))
+        idx, p, rest = idx[keep], p[keep], q[keep]
+        e = np.ones(len(idx), dtype=np.int64)
+        live = np.flatnonzero(rest > 1)
+        while len(live):
+            rest[live] //= p[live]
+            e[live] += 1
+            live = live[(rest[live] > 1) & (rest[live] % p[live] == 0)]
+        good = rest == 1
+        mask[idx[good]] = True
+        base[idx[good]] = p[good]
+        exp[idx[good]] = e[good]
+    shape = m.shape
+    if return_parts:
+        return mask.reshape(shape), base.reshape(shape), exp.reshape(shape)
+    return mask.reshape(shape)
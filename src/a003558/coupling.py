@@ -1,7 +1,7 @@
 
 from __future__ import annotations
 import numpy as np
-from .octonions import octonion_mul, norm
+from .octonions import norm, norm_batch, octonion_mul, octonion_mul_batch
 
 def dyadic_clock_to_octonion(k: int, phase: float = 0.0) -> np.ndarray:
     theta = (np.pi / (2**k)) + phase
@@ -15,3 +15,26 @@ def coupled_step(k_brain: int, k_cosmos: int) -> float:
     b = dyadic_clock_to_octonion(k_cosmos, phase=np.pi/8)
     c = octonion_mul(a, b)
     return abs(norm(c) - norm(a)*norm(b))
+
+def _clock_octonions(k: np.ndarray, phase: np.ndarray) -> np.ndarray:
+    theta = np.ldexp(np.pi, -k) + phase
+    v = np.zeros(theta.shape + (8,))
+    v[..., 0] = np.cos(theta)
+    v[..., 1] = np.sin(theta)
+    return v
+
+def coupled_sweep(k_brain, k_cosmos, phases=np.pi/8) -> np.ndarray:
+    """
+    coupled_step over the full grid k_brain × k_cosmos (× phases) in one pass.
+
+    Returns the composition-norm errors with shape (len(k_brain), len(k_cosmos)),
+    or (len(k_brain), len(k_cosmos), len(phases)) when phases is an array.
+    """
+    kb = np.asarray(k_brain, dtype=int).reshape(-1, 1, 1)
+    kc = np.asarray(k_cosmos, dtype=int).reshape(1, -1, 1)
+    ph = np.asarray(phases, dtype=float)
+    a = _clock_octonions(kb, 0.0)
+    b = _clock_octonions(kc, ph.reshape(1, 1, -1))
+    c = octonion_mul_batch(a, b)
+    err = np.abs(norm_batch(c) - norm_batch(a) * norm_batch(b))
+    return err[..., 0] if ph.ndim == 0 else err
@@ -4,19 +4,491 @@ Export routines to generate simple OBJ geometry for Blender or other 3D tools.
 
 from __future__ import annotations
 
-import math
+import json
 import os
-from typing import Iterable
+import struct
+from functools import lru_cache
+from typing import Iterable, Iterator
 
+import numpy as np
 
-def _write_obj(path: str, vertices: list[tuple[float, float, float]], faces: list[tuple[int, int, int]]) -> str:
-    """Write a minimal Wavefront OBJ file."""
-    with open(path, "w", encoding="utf-8") as f:
-        for v in vertices:
-            f.write(f"v {v[0]} {v[1]} {v[2]}\n")
-        for face in faces:
-            f.write("f " + " ".join(str(i) for i in face) + "\n")
-    return path
+# Basisvormen (0-gebaseerde face-indices), gedeeld door alle exporters.
+CUBE_VERTICES = np.array([
+    (-1, -1, -1), (-1, -1, 1), (-1, 1, -1), (-1, 1, 1),
+    (1, -1, -1), (1, -1, 1), (1, 1, -1), (1, 1, 1),
+], dtype=float)
+CUBE_FACES = np.array([
+    (0, 1, 3), (0, 3, 2), (4, 6, 7), (4, 7, 5), (0, 4, 5), (0, 5, 1),
+    (1, 5, 7), (1, 7, 3), (2, 3, 7), (2, 7, 6), (0, 2, 6), (0, 6, 4),
+], dtype=np.int64)
+OCTA_VERTICES = np.array([
+    (1, 0, 0), (-1, 0, 0), (0, 1, 0), (0, -1, 0), (0, 0, 1), (0, 0, -1),
+], dtype=float)
+OCTA_FACES = np.array([
+    (0, 2, 4), (2, 1, 4), (1, 3, 4), (3, 0, 4),
+    (2, 0, 5), (1, 2, 5), (3, 1, 5), (0, 3, 5),
+], dtype=np.int64)
+
+# De acht veldkleuren uit tools/generate_octahedron.py (FIELDS, in vlakvolgorde).
+FIELD_COLORS_HEX = (
+    "#00BCD4", "#1E88E5", "#7E57C2", "#EC407A",
+    "#43A047", "#FDD835", "#FB8C00", "#E53935",
+)
+FIELD_COLORS = np.array(
+    [[int(h[i:i + 2], 16) for i in (1, 3, 5)] for h in FIELD_COLORS_HEX], dtype=np.uint8
+)
+
+# Octaëder met eigen vertices per vlak, zodat elk vlak zijn veldkleur draagt.
+OCTA_FIELD_VERTICES = OCTA_VERTICES[OCTA_FACES].reshape(-1, 3)
+OCTA_FIELD_FACES = np.arange(24, dtype=np.int64).reshape(8, 3)
+
+SOLIDS = {
+    "cube": (CUBE_VERTICES, CUBE_FACES),
+    "octa": (OCTA_VERTICES, OCTA_FACES),
+    "octa_fields": (OCTA_FIELD_VERTICES, OCTA_FIELD_FACES),
+}
+SOLID_COLORS = {
+    "cube": FIELD_COLORS,
+    "octa": FIELD_COLORS[:6],
+    "octa_fields": np.repeat(FIELD_COLORS, 3, axis=0),
+}
+
+
+class ObjWriter:
+    """
+    Gebufferde, streamende Wavefront OBJ-schrijver voor grote scènes.
+
+    Vertices (N, 3) en faces (M, k, 0-gebaseerd per object) worden als NumPy-
+    blokken aangeleverd en per blok in één `%`-formattering omgezet; face-
+    indices worden automatisch verschoven over opeenvolgende objecten.
+
+    Coördinaten worden met `precision` vaste decimalen geschreven (`%.6f`),
+    zodat de absolute nauwkeurigheid niet afhangt van de grootte van de
+    coördinaat (bij `%g` zouden kleine vormen rond x ≈ 1e5 inklappen).
+
+    Gebruik als context manager::
+
+        with ObjWriter("scene.obj") as w:
+            w.add_object(verts, faces, name="octa_0")
+    """
+
+    def __init__(self, path: str, precision: int = 6, block: int = 1 << 16,
+                 buffer_size: int = 1 << 22):
+        self.path = str(path)
+        self.block = block
+        self.vertex_count = 0
+        self.face_count = 0
+        self.objects: list[tuple[str | None, int, int]] = []
+        self._vfmt = f"v %.{precision}f %.{precision}f %.{precision}f\n"
+        self._f = open(self.path, "w", encoding="utf-8", buffering=buffer_size)
+
+    def __enter__(self) -> "ObjWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if not self._f.closed:
+            self._f.close()
+
+    def _write_vertices(self, v: np.ndarray) -> None:
+        for lo in range(0, len(v), self.block):
+            chunk = v[lo:lo + self.block]
+            self._f.write((self._vfmt * len(chunk)) % tuple(chunk.ravel().tolist()))
+
+    def _write_faces(self, f: np.ndarray) -> None:
+        fmt = "f" + " %d" * f.shape[1] + "\n"
+        for lo in range(0, len(f), self.block):
+            chunk = f[lo:lo + self.block]
+            self._f.write((fmt * len(chunk)) % tuple(chunk.ravel().tolist()))
+
+    def add_object(self, vertices, faces, name: str | None = None) -> tuple[int, int]:
+        """
+        Voeg één object toe; `faces` verwijst 0-gebaseerd naar de eigen vertices.
+
+        Retourneert het (start, stop) bereik van de vertices in het bestand.
+        """
+        v = np.asarray(vertices, dtype=float).reshape(-1, 3)
+        f = np.asarray(faces, dtype=np.int64)
+        if f.size and (f.ndim != 2 or f.min() < 0 or f.max() >= len(v)):
+            raise ValueError("faces must be (M, k) indices into this object's vertices")
+        if name is not None:
+            self._f.write(f"o {name}\n")
+        start = self.vertex_count
+        self._write_vertices(v)
+        if f.size:
+            self._write_faces(f + (start + 1))
+        self.vertex_count += len(v)
+        self.face_count += len(f)
+        self.objects.append((name, start, self.vertex_count))
+        return start, self.vertex_count
+
+    def add_chunks(self, chunks: Iterable[tuple[np.ndarray, np.ndarray]],
+                   name: str | None = None) -> None:
+        """Schrijf een generator van (vertices, faces)-blokken als één doorlopend object."""
+        if name is not None:
+            self._f.write(f"o {name}\n")
+            name = None
+        for v, f in chunks:
+            self.add_object(v, f, name=name)
+
+    def add_instances(self, vertices, faces, names: Iterable[str]) -> np.ndarray:
+        """
+        N benoemde objecten met dezelfde topologie: `vertices` (N, V, 3), `faces`
+        (F, k) 0-gebaseerd binnen één object.  Eén `%`-template per blok objecten,
+        dus geen Python-lus per object of vertex.
+
+        Retourneert de vertex-startindex (0-gebaseerd) van elk object.
+        """
+        v = np.asarray(vertices, dtype=float)
+        f = np.asarray(faces, dtype=np.int64)
+        names = np.asarray(list(names), dtype=object)
+        n, nv = v.shape[0], v.shape[1]
+        if v.ndim != 3 or v.shape[2] != 3 or len(names) != n:
+            raise ValueError("vertices must be (N, V, 3) with one name per object")
+        template = "o %s\n" + self._vfmt * nv + ("f" + " %d" * f.shape[1] + "\n") * len(f)
+        starts = self.vertex_count + nv * np.arange(n, dtype=np.int64)
+        per = max(1, self.block // max(nv, 1))
+        for lo in range(0, n, per):
+            hi = min(n, lo + per)
+            args = np.empty((hi - lo, 1 + 3 * nv + f.size), dtype=object)
+            args[:, 0] = names[lo:hi]
+            args[:, 1:1 + 3 * nv] = v[lo:hi].reshape(hi - lo, -1)
+            args[:, 1 + 3 * nv:] = f.ravel()[None, :] + (starts[lo:hi] + 1)[:, None]
+            self._f.write((template * (hi - lo)) % tuple(args.ravel().tolist()))
+        for name, start in zip(names.tolist(), starts.tolist()):
+            self.objects.append((name, start, start + nv))
+        self.vertex_count += n * nv
+        self.face_count += n * len(f)
+        return starts
+
+
+def solid_instances(
+    centers: np.ndarray,
+    solid: str = "octa",
+    scale=1.0,
+    chunk: int = 1 << 14,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """
+    Procedurele mesh: één `solid` ("octa" of "cube") per centrum, in blokken.
+
+    Vertices komen uit broadcasting (basis * schaal + centrum), faces uit de
+    basisfaces plus een offset per kopie; geen Python-lus per vertex.
+    """
+    base_v, base_f = SOLIDS[solid]
+    c = np.asarray(centers, dtype=float).reshape(-1, 3)
+    s = np.broadcast_to(np.asarray(scale, dtype=float), (len(c),))
+    nv = len(base_v)
+    for lo in range(0, len(c), chunk):
+        cc, ss = c[lo:lo + chunk], s[lo:lo + chunk]
+        verts = base_v[None, :, :] * ss[:, None, None] + cc[:, None, :]
+        faces = base_f[None, :, :] + (nv * np.arange(len(cc)))[:, None, None]
+        yield verts.reshape(-1, 3), faces.reshape(-1, base_f.shape[1])
+
+
+def export_solids_obj(path: str, centers, solid: str = "octa", scale=1.0,
+                      precision: int = 6) -> str:
+    """Exporteer één octaëder/kubus per centrum als streamend OBJ-bestand."""
+    with ObjWriter(path, precision=precision) as w:
+        w.add_chunks(solid_instances(centers, solid=solid, scale=scale), name=solid)
+    return str(path)
+
+
+def solid_mesh(centers, solid: str = "octa_fields", scale=1.0):
+    """
+    Volledige (vertices, faces, colors)-arrays voor één `solid` per centrum.
+
+    `colors` is (V, 3) uint8 met de veldkleuren van de basisvorm, per kopie herhaald.
+    """
+    parts = list(solid_instances(centers, solid=solid, scale=scale))
+    base_v, base_f = SOLIDS[solid]
+    if parts:
+        verts = np.concatenate([v for v, _ in parts])
+        faces = np.concatenate([f for _, f in parts])
+    else:
+        verts = np.zeros((0, 3))
+        faces = np.zeros((0, base_f.shape[1]), dtype=np.int64)
+    colors = np.tile(SOLID_COLORS[solid], (len(verts) // len(base_v), 1))
+    return verts, faces, colors
+
+
+def _rgba(colors, n: int) -> np.ndarray:
+    """Kleuren als (n, 4) uint8; floats worden als [0, 1] geïnterpreteerd."""
+    c = np.asarray(colors)
+    if c.ndim != 2 or len(c) != n or c.shape[1] not in (3, 4):
+        raise ValueError("colors must have shape (V, 3) or (V, 4)")
+    if c.dtype.kind == "f":
+        c = np.rint(np.clip(c, 0.0, 1.0) * 255)
+    out = np.full((n, 4), 255, dtype=np.uint8)
+    out[:, :c.shape[1]] = c
+    return out
+
+
+def _mesh_arrays(vertices, faces):
+    v = np.ascontiguousarray(vertices, dtype="<f4").reshape(-1, 3)
+    f = np.asarray(faces, dtype=np.int64)
+    if f.ndim != 2 or (f.size and (f.min() < 0 or f.max() >= len(v))):
+        raise ValueError("faces must be (M, k) 0-based indices into vertices")
+    return v, np.ascontiguousarray(f, dtype="<u4")
+
+
+def export_ply(path: str, vertices, faces, colors=None) -> str:
+    """
+    Binaire little-endian PLY; vertex- en face-records komen als één
+    gestructureerde NumPy-array in één keer uit `tobytes()`.
+    """
+    v, f = _mesh_arrays(vertices, faces)
+    fields = [("x", "<f4"), ("y", "<f4"), ("z", "<f4")]
+    if colors is not None:
+        fields += [("red", "u1"), ("green", "u1"), ("blue", "u1"), ("alpha", "u1")]
+    vrec = np.empty(len(v), dtype=fields)
+    vrec["x"], vrec["y"], vrec["z"] = v.T
+    if colors is not None:
+        rgba = _rgba(colors, len(v))
+        for i, name in enumerate(("red", "green", "blue", "alpha")):
+            vrec[name] = rgba[:, i]
+    k = f.shape[1]
+    frec = np.empty(len(f), dtype=[("n", "u1"), ("idx", "<u4", (k,))])
+    frec["n"] = k
+    frec["idx"] = f
+
+    header = ["ply", "format binary_little_endian 1.0", f"element vertex {len(v)}",
+              "property float x", "property float y", "property float z"]
+    if colors is not None:
+        header += [f"property uchar {c}" for c in ("red", "green", "blue", "alpha")]
+    header += [f"element face {len(f)}", "property list uchar uint vertex_indices",
+               "end_header"]
+    with open(path, "wb") as fh:
+        fh.write(("\n".join(header) + "\n").encode("ascii"))
+        fh.write(vrec.tobytes())
+        fh.write(frec.tobytes())
+    return str(path)
+
+
+def _pad4(b: bytes, fill: bytes) -> bytes:
+    return b + fill * (-len(b) % 4)
+
+
+def _glb_mesh(v: np.ndarray, f: np.ndarray, colors) -> tuple[dict, list]:
+    """glTF-mesh plus buffers voor één driehoeksmesh (accessors 0.., views 0..)."""
+    if f.size and f.shape[1] != 3:
+        raise ValueError("glTF export expects triangles")
+    lo = v.min(axis=0).tolist() if len(v) else [0.0] * 3
+    hi = v.max(axis=0).tolist() if len(v) else [0.0] * 3
+    blobs = [(v, 34962), (f, 34963)]
+    accessors = [
+        {"componentType": 5126, "count": len(v), "type": "VEC3", "min": lo, "max": hi},
+        {"componentType": 5125, "count": int(f.size), "type": "SCALAR"},
+    ]
+    attributes = {"POSITION": 0}
+    if colors is not None:
+        blobs.append((_rgba(colors, len(v)), 34962))
+        accessors.append({"componentType": 5121, "normalized": True, "count": len(v),
+                          "type": "VEC4"})
+        attributes["COLOR_0"] = 2
+    gltf = {
+        "asset": {"version": "2.0", "generator": "a003558.export_blender"},
+        "scene": 0,
+        "scenes": [{"nodes": [0]}],
+        "nodes": [{"mesh": 0}],
+        "meshes": [{"primitives": [{"attributes": attributes, "indices": 1, "mode": 4}]}],
+        "accessors": accessors,
+    }
+    return gltf, blobs
+
+
+def _write_glb(path: str, gltf: dict, blobs: list) -> str:
+    """
+    Schrijf een .glb: accessor i leest bufferView i, die blob i uit het ene
+    BIN-chunk beschrijft (4-byte uitgelijnd, direct vanuit NumPy-geheugen).
+    """
+    views, offset, raw = [], 0, []
+    for accessor, (arr, target) in zip(gltf["accessors"], blobs):
+        mv = memoryview(np.ascontiguousarray(arr)).cast("B")
+        view = {"buffer": 0, "byteOffset": offset, "byteLength": mv.nbytes}
+        if target is not None:
+            view["target"] = target
+        accessor["bufferView"] = len(views)
+        views.append(view)
+        raw.append(mv)
+        offset += mv.nbytes + (-mv.nbytes % 4)
+    gltf["buffers"] = [{"byteLength": offset}]
+    gltf["bufferViews"] = views
+
+    json_chunk = _pad4(json.dumps(gltf, separators=(",", ":")).encode("utf-8"), b" ")
+    total = 12 + 8 + len(json_chunk) + 8 + offset
+    with open(path, "wb") as fh:
+        fh.write(struct.pack("<III", 0x46546C67, 2, total))
+        fh.write(struct.pack("<II", len(json_chunk), 0x4E4F534A))
+        fh.write(json_chunk)
+        fh.write(struct.pack("<II", offset, 0x004E4942))
+        for mv in raw:
+            fh.write(mv)
+            fh.write(b"\0" * (-mv.nbytes % 4))
+    return str(path)
+
+
+def export_glb(path: str, vertices, faces, colors=None) -> str:
+    """
+    glTF 2.0 binary (.glb) met één driehoeksmesh: POSITION (float32),
+    optioneel COLOR_0 (genormaliseerde RGBA uint8) en uint32-indices.
+    """
+    v, f = _mesh_arrays(vertices, faces)
+    gltf, blobs = _glb_mesh(v, f, colors)
+    return _write_glb(path, gltf, blobs)
+
+
+def _instance_trs(translations, rotations, scales):
+    t = np.asarray(translations, dtype="<f4").reshape(-1, 3)
+    n = len(t)
+    if rotations is None:
+        r = np.zeros((n, 4), dtype="<f4")
+        r[:, 3] = 1.0
+    else:
+        r = np.asarray(rotations, dtype=float).reshape(n, 4)
+        r = (r / np.linalg.norm(r, axis=1, keepdims=True)).astype("<f4")
+    sc = np.asarray(1.0 if scales is None else scales, dtype="<f4")
+    sc = np.ascontiguousarray(np.broadcast_to(sc.reshape(-1, 1) if sc.ndim == 1 else sc, (n, 3)))
+    return t, r, sc
+
+
+def instance_matrices(translations, rotations=None, scales=None) -> np.ndarray:
+    """
+    (N, 4, 4) float32 transformatiematrices T @ R @ S per instantie.
+
+    `rotations` zijn eenheidsquaternionen (x, y, z, w) zoals in glTF; `scales`
+    is een scalar, (N,) of (N, 3).  Kolomvectorconventie: p' = M @ [p, 1].
+    """
+    t, q, s = _instance_trs(translations, rotations, scales)
+    x, y, z, w = q.astype(float).T
+    rot = np.stack([
+        1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w),
+        2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w),
+        2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y),
+    ], axis=-1).reshape(-1, 3, 3)
+    m = np.zeros((len(t), 4, 4), dtype=np.float32)
+    m[:, :3, :3] = rot * s[:, None, :]
+    m[:, :3, 3] = t
+    m[:, 3, 3] = 1.0
+    return m
+
+
+def apply_instances(vertices, matrices) -> np.ndarray:
+    """Basisvertices (V, 3) getransformeerd door elke matrix: (N, V, 3)."""
+    v = np.asarray(vertices, dtype=float).reshape(-1, 3)
+    m = np.asarray(matrices, dtype=float)
+    return np.einsum("nij,vj->nvi", m[:, :3, :3], v) + m[:, None, :3, 3]
+
+
+def export_instanced_glb(path: str, translations, rotations=None, scales=None,
+                         solid: str = "octa_fields", colors: bool = True) -> str:
+    """
+    Eén basisvorm plus EXT_mesh_gpu_instancing (TRANSLATION/ROTATION/SCALE per
+    instantie): de bestandsgrootte groeit met het aantal instanties, niet met
+    instanties × meshgrootte.
+    """
+    base_v, base_f = SOLIDS[solid]
+    v, f = _mesh_arrays(base_v, base_f)
+    gltf, blobs = _glb_mesh(v, f, SOLID_COLORS[solid] if colors else None)
+    t, r, s = _instance_trs(translations, rotations, scales)
+    attrs = {}
+    for name, arr, kind in (("TRANSLATION", t, "VEC3"), ("ROTATION", r, "VEC4"),
+                            ("SCALE", s, "VEC3")):
+        attrs[name] = len(gltf["accessors"])
+        gltf["accessors"].append({"componentType": 5126, "count": len(t), "type": kind})
+        blobs.append((arr, None))
+    gltf["nodes"][0]["extensions"] = {"EXT_mesh_gpu_instancing": {"attributes": attrs}}
+    gltf["extensionsUsed"] = ["EXT_mesh_gpu_instancing"]
+    return _write_glb(path, gltf, blobs)
+
+
+def export_instanced_obj(path: str, translations, rotations=None, scales=None,
+                         solid: str = "octa") -> tuple[str, str]:
+    """
+    Basisvorm één keer als OBJ plus een sidecar `<naam>_instances.npy` met
+    (N, 4, 4) float32-matrices (zie `instance_matrices`).
+    """
+    npy_path = os.path.splitext(str(path))[0] + "_instances.npy"
+    with ObjWriter(path) as w:
+        w.add_object(*SOLIDS[solid], name=solid)
+    np.save(npy_path, instance_matrices(translations, rotations, scales))
+    return str(path), npy_path
+
+
+@lru_cache(maxsize=None)
+def icosphere(subdivisions: int = 1) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Eenheids-icosfeer: icosaëder met `subdivisions` keer 4-voudige
+    driehoeksdeling (12 → 42 → 162 → ... vertices), gecachet per niveau.
+    """
+    t = (1 + 5 ** 0.5) / 2
+    v = np.array([
+        (-1, t, 0), (1, t, 0), (-1, -t, 0), (1, -t, 0), (0, -1, t), (0, 1, t),
+        (0, -1, -t), (0, 1, -t), (t, 0, -1), (t, 0, 1), (-t, 0, -1), (-t, 0, 1),
+    ], dtype=float)
+    f = np.array([
+        (0, 11, 5), (0, 5, 1), (0, 1, 7), (0, 7, 10), (0, 10, 11),
+        (1, 5, 9), (5, 11, 4), (11, 10, 2), (10, 7, 6), (7, 1, 8),
+        (3, 9, 4), (3, 4, 2), (3, 2, 6), (3, 6, 8), (3, 8, 9),
+        (4, 9, 5), (2, 4, 11), (6, 2, 10), (8, 6, 7), (9, 8, 1),
+    ], dtype=np.int64)
+    v /= np.linalg.norm(v, axis=1, keepdims=True)
+    for _ in range(subdivisions):
+        edges = np.sort(np.concatenate([f[:, [0, 1]], f[:, [1, 2]], f[:, [2, 0]]]), axis=1)
+        uniq, inv = np.unique(edges, axis=0, return_inverse=True)
+        mid = v[uniq].mean(axis=1)
+        mid /= np.linalg.norm(mid, axis=1, keepdims=True)
+        ab, bc, ca = inv.reshape(3, -1) + len(v)
+        a, b, c = f.T
+        f = np.concatenate([
+            np.stack([a, ab, ca], axis=1), np.stack([ab, b, bc], axis=1),
+            np.stack([ca, bc, c], axis=1), np.stack([ab, bc, ca], axis=1),
+        ])
+        v = np.concatenate([v, mid])
+    v.flags.writeable = False
+    f.flags.writeable = False
+    return v, f
+
+
+@lru_cache(maxsize=None)
+def uv_sphere(segments: int = 16, rings: int = 8) -> tuple[np.ndarray, np.ndarray]:
+    """Eenheids-UV-sfeer met `segments` meridianen en `rings` breedtebanden."""
+    if segments < 3 or rings < 2:
+        raise ValueError("need segments >= 3 and rings >= 2")
+    theta = np.pi * np.arange(1, rings) / rings
+    phi = 2 * np.pi * np.arange(segments) / segments
+    st, ct = np.sin(theta)[:, None], np.cos(theta)[:, None]
+    ring = np.stack([st * np.cos(phi), st * np.sin(phi), np.repeat(ct, segments, axis=1)],
+                    axis=-1)
+    v = np.concatenate([[(0.0, 0.0, 1.0)], ring.reshape(-1, 3), [(0.0, 0.0, -1.0)]])
+    j = np.arange(segments)
+    jn = (j + 1) % segments
+    top = np.stack([np.zeros(segments, dtype=np.int64), 1 + j, 1 + jn], axis=1)
+    r = np.arange(rings - 2)[:, None] * segments + 1
+    a, b, c, d = r + j, r + jn, r + segments + j, r + segments + jn
+    quads = np.concatenate([np.stack([a, c, d], axis=-1), np.stack([a, d, b], axis=-1)], axis=1)
+    last = len(v) - 1
+    base = 1 + (rings - 2) * segments
+    bottom = np.stack([np.full(segments, last), base + jn, base + j], axis=1)
+    f = np.concatenate([top, quads.reshape(-1, 3), bottom]).astype(np.int64)
+    v.flags.writeable = False
+    f.flags.writeable = False
+    return v, f
+
+
+def sphere_mesh(lod: int = 1, kind: str = "ico") -> tuple[np.ndarray, np.ndarray]:
+    """
+    Eenheidssfeer op detailniveau `lod`: icosfeer met `lod` delingen, of
+    UV-sfeer met 8·2^lod segmenten en half zoveel ringen.
+    """
+    if lod < 0:
+        raise ValueError("lod must be >= 0")
+    if kind == "ico":
+        return icosphere(lod)
+    if kind == "uv":
+        return uv_sphere(8 << lod, 4 << lod)
+    raise ValueError("kind must be 'ico' or 'uv'")
 
 
 def export_octa_cube_obj(out_dir: str, basename: str = "scene") -> dict[str, str]:
@@ -33,56 +505,12 @@ def export_octa_cube_obj(out_dir: str, basename: str = "scene") -> dict[str, str
     """
     os.makedirs(out_dir, exist_ok=True)
 
-    # Eenhedenkubus (vertices van -1 tot 1)
-    cube_vertices = [
-        (-1, -1, -1),
-        (-1, -1, 1),
-        (-1, 1, -1),
-        (-1, 1, 1),
-        (1, -1, -1),
-        (1, -1, 1),
-        (1, 1, -1),
-        (1, 1, 1),
-    ]
-    cube_faces = [
-        (1, 2, 4),
-        (1, 4, 3),
-        (5, 7, 8),
-        (5, 8, 6),
-        (1, 5, 6),
-        (1, 6, 2),
-        (2, 6, 8),
-        (2, 8, 4),
-        (3, 4, 8),
-        (3, 8, 7),
-        (1, 3, 7),
-        (1, 7, 5),
-    ]
-
-    octa_vertices = [
-        (1, 0, 0),
-        (-1, 0, 0),
-        (0, 1, 0),
-        (0, -1, 0),
-        (0, 0, 1),
-        (0, 0, -1),
-    ]
-    octa_faces = [
-        (1, 3, 5),
-        (3, 2, 5),
-        (2, 4, 5),
-        (4, 1, 5),
-        (3, 1, 6),
-        (2, 3, 6),
-        (4, 2, 6),
-        (1, 4, 6),
-    ]
-
     cube_path = os.path.join(out_dir, f"{basename}_cube.obj")
     octa_path = os.path.join(out_dir, f"{basename}_octa.obj")
 
-    _write_obj(cube_path, cube_vertices, cube_faces)
-    _write_obj(octa_path, octa_vertices, octa_faces)
+    for solid, out_path in (("cube", cube_path), ("octa", octa_path)):
+        with ObjWriter(out_path) as w:
+            w.add_object(*SOLIDS[solid])
 
     return {"cube": cube_path, "octa": octa_path}
 
@@ -92,9 +520,18 @@ def export_label_spheres_obj(
     basename: str = "labels",
     labels: Iterable[str] | None = None,
     path: str | None = None,
-) -> str:
+    positions=None,
+    radius: float = 0.15,
+    lod: int = 1,
+    kind: str = "ico",
+    return_index: bool = False,
+):
     """
-    Exporteer labels als kleine sferen (hier gesimuleerd als punten) naar OBJ-bestand.
+    Exporteer labels als kleine sferen (één benoemd OBJ-object per label).
+
+    De eenheidssfeer wordt één keer opgebouwd (zie `sphere_mesh`) en per label
+    via broadcasting geschaald en verschoven; alle objecten gaan in blokken
+    van één `%`-formattering naar het bestand, zodat ook 10^5 labels vlot gaan.
 
     Parameters
     ----------
@@ -103,14 +540,26 @@ def export_label_spheres_obj(
     basename : str
         Basisnaam van het bestand.
     labels : Iterable[str], optional
-        Namen van labels (momenteel niet gebruikt in geometrie).
+        Namen van labels; worden de objectnamen in het OBJ-bestand.
     path : str, optional
         Volledig pad naar output-bestand. Heeft voorrang op `out_dir` + `basename`.
+    positions : array (N, 3), optional
+        Middelpunten van de sferen; standaard een cirkel met straal 2 in z=0.
+    radius : float of array (N,)
+        Straal per sfeer.
+    lod : int
+        Detailniveau (zie `sphere_mesh`).
+    kind : {"ico", "uv"}
+        Icosfeer of UV-sfeer.
+    return_index : bool
+        Geef ook de index terug: een lijst (label, vertex_start, vertex_stop),
+        0-gebaseerd en in de volgorde van `labels`, zodat ook dubbele labels
+        elk hun eigen object houden.
 
     Returns
     -------
-    str
-        Pad naar geschreven bestand.
+    str of (str, list)
+        Pad naar geschreven bestand (en eventueel de index).
     """
     if path is not None:
         out_path = str(path)
@@ -120,18 +569,25 @@ def export_label_spheres_obj(
         os.makedirs(out_dir, exist_ok=True)
         out_path = os.path.join(out_dir, f"{basename}.obj")
 
-    # Voorlopig: schrijf enkel vertices als punten
-    verts: list[tuple[float, float, float]] = []
-    if labels:
-        r = 2.0
-        for i, _ in enumerate(labels):
-            angle = (2 * math.pi * i) / len(labels)
-            verts.append((r * math.cos(angle), r * math.sin(angle), 0.0))
+    names = [" ".join(str(label).split()) or "label" for label in (labels or [])]
+    n = len(names)
+    if positions is None:
+        angle = 2 * np.pi * np.arange(n) / max(n, 1)
+        centers = np.stack([2.0 * np.cos(angle), 2.0 * np.sin(angle), np.zeros(n)], axis=1)
     else:
-        verts = [(0.0, 0.0, 0.0)]
+        centers = np.asarray(positions, dtype=float).reshape(-1, 3)
+        if len(centers) != n:
+            raise ValueError("positions must have one row per label")
+    r = np.broadcast_to(np.asarray(radius, dtype=float), (n,))
 
-    with open(out_path, "w", encoding="utf-8") as f:
-        for v in verts:
-            f.write(f"v {v[0]} {v[1]} {v[2]}\n")
+    base_v, base_f = sphere_mesh(lod, kind)
+    with ObjWriter(out_path) as w:
+        starts = w.add_instances(
+            base_v[None, :, :] * r[:, None, None] + centers[:, None, :], base_f, names
+        )
 
-    return out_path
+    if not return_index:
+        return out_path
+    nv = len(base_v)
+    index = [(name, start, start + nv) for name, start in zip(names, starts.tolist())]
+    return out_path, index
@@ -0,0 +1,159 @@
+"""
+Pluggable integer factorization backends.
+
+`factorint(n)` returns {p: e} through the active backend:
+
+- "trial": plain trial division up to sqrt(n) (the original behaviour)
+- "rho":   small-prime pre-pass, deterministic Miller–Rabin and
+           Pollard–Rho (Brent variant) for the remaining cofactors
+
+Any callable n -> {p: e} can be installed with `set_backend`.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from typing import Callable, Dict
+
+Factorization = Dict[int, int]
+
+_SMALL_PRIMES = [p for p in range(2, 1000) if all(p % d for d in range(2, int(p ** 0.5) + 1))]
+# Deterministic for n < 3.3e24 (first 13 primes as bases); beyond that a
+# strong probable-prime test with the same bases.
+_MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+
+def is_probable_prime(n: int) -> bool:
+    """Miller–Rabin primality test (deterministic for n < 3.3e24)."""
+    if n < 2:
+        return False
+    for p in _SMALL_PRIMES[:13]:
+        if n % p == 0:
+            return n == p
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _MR_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def pollard_brent(n: int, seed: int = 1) -> int:
+    """Nontrivial factor of an odd composite n (Brent's cycle detection)."""
+    if n % 2 == 0:
+        return 2
+    rng = random.Random(seed)
+    while True:
+        y = rng.randrange(1, n)
+        c = rng.randrange(1, n)
+        m = 128
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+
+
+def trial_factor(n: int) -> Factorization:
+    """Factorization by trial division up to sqrt(n)."""
+    if n <= 0:
+        raise ValueError("n must be positive")
+    out: Factorization = {}
+    m = n
+    p = 2
+    while p * p <= m:
+        while m % p == 0:
+            out[p] = out.get(p, 0) + 1
+            m //= p
+        p = 3 if p == 2 else p + 2
+    if m > 1:
+        out[m] = out.get(m, 0) + 1
+    return out
+
+
+def rho_factor(n: int) -> Factorization:
+    """Factorization by small-prime pre-pass plus Miller–Rabin / Pollard–Rho."""
+    if n <= 0:
+        raise ValueError("n must be positive")
+    out: Factorization = {}
+    m = n
+    for p in _SMALL_PRIMES:
+        if p * p > m:
+            break
+        while m % p == 0:
+            out[p] = out.get(p, 0) + 1
+            m //= p
+    stack = [m] if m > 1 else []
+    while stack:
+        x = stack.pop()
+        if x < _SMALL_PRIMES[-1] ** 2 or is_probable_prime(x):
+            out[x] = out.get(x, 0) + 1
+            continue
+        r = math.isqrt(x)
+        if r * r == x:
+            stack += [r, r]
+            continue
+        d = pollard_brent(x)
+        stack += [d, x // d]
+    return dict(sorted(out.items()))
+
+
+BACKENDS: dict[str, Callable[[int], Factorization]] = {
+    "trial": trial_factor,
+    "rho": rho_factor,
+}
+
+_backend: Callable[[int], Factorization] = rho_factor
+
+
+def set_backend(backend: str | Callable[[int], Factorization]) -> None:
+    """Select the factorization backend by name or install a callable."""
+    global _backend
+    if isinstance(backend, str):
+        if backend not in BACKENDS:
+            raise ValueError(f"unknown backend {backend!r}; choose from {sorted(BACKENDS)}")
+        _backend = BACKENDS[backend]
+    elif callable(backend):
+        _backend = backend
+    else:
+        raise TypeError("backend must be a name or a callable")
+
+
+def get_backend() -> Callable[[int], Factorization]:
+    return _backend
+
+
+def factorint(n: int) -> Factorization:
+    """Prime factorization {p: e} of n >= 1 via the active backend."""
+    if n <= 0:
+        raise ValueError("n must be positive")
+    if n == 1:
+        return {}
+    return _backend(n)
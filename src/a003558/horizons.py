@@ -1,5 +1,6 @@
 from __future__ import annotations
-import math
+
+import numpy as np
 
 def staircase_level(n: int) -> int:
     """
@@ -19,5 +20,89 @@ def horizon_bound(n: int, L: int) -> bool:
     """
     Horizon condition: if L = ord_{2n-1}(2) then n <= 2^{L-1},
     equivalently: L >= 1 + ceil(log2 n).
+
+    ceil(log2 n) = bit_length(n-1), exact for arbitrarily large n; NumPy
+    integer scalars are accepted as well.
+    """
+    return L >= 1 + (int(n) - 1).bit_length()
+
+
+# ---------- Vectoriële varianten (exacte integer-bitoperaties) ----------
+
+_bit_length_obj = np.frompyfunc(int.bit_length, 1, 1)
+
+
+def _as_int_array(n) -> np.ndarray:
+    """Als integer-array; lijsten met big ints worden object-arrays, geen floats."""
+    if isinstance(n, np.ndarray):
+        return n
+    arr = np.asarray(n)
+    if arr.dtype.kind in "fO":
+        arr = np.asarray(n, dtype=object)
+        if not all(isinstance(x, (int, np.integer)) for x in arr.flat):
+            raise TypeError("n moet integers bevatten")
+    return arr
+
+
+def bit_length_array(n) -> np.ndarray:
+    """
+    Elementgewijze int.bit_length voor niet-negatieve integer-arrays.
+
+    (u)int64-arrays gaan via binaire zoek-shifts; object-arrays met Python
+    big ints via int.bit_length.  Nergens floats, dus geen afrondingsfouten.
     """
-    return L >= 1 + math.ceil(math.log2(n))
+    arr = _as_int_array(n)
+    if arr.dtype == object:
+        return _bit_length_obj(arr).astype(np.int64)
+    if not np.issubdtype(arr.dtype, np.integer):
+        raise TypeError("n moet integers bevatten")
+    if np.issubdtype(arr.dtype, np.signedinteger) and arr.size and arr.min() < 0:
+        raise ValueError("n moet niet-negatief zijn")
+    m = arr.astype(np.uint64)
+    k = np.zeros(m.shape, dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        big = (m >> np.uint64(shift)) > 0
+        k[big] += shift
+        m[big] >>= np.uint64(shift)
+    k += m > 0
+    return k
+
+
+def staircase_level_array(n) -> np.ndarray:
+    """Vectoriële staircase_level: 1 + floor(log2 n) = bit_length(n)."""
+    arr = _as_int_array(n)
+    if arr.size and np.any(arr < 1):
+        raise ValueError("n moet positief zijn")
+    return bit_length_array(arr)
+
+
+def horizon_bound_array(n, L) -> np.ndarray:
+    """Vectoriële horizon_bound: L >= 1 + bit_length(n-1), elementgewijs."""
+    arr = _as_int_array(n)
+    if arr.size and np.any(arr < 1):
+        raise ValueError("n moet positief zijn")
+    return np.asarray(L) >= 1 + bit_length_array(arr - 1)
+
+
+def verify_horizon(stop: int, start: int = 1, chunk: int = 1 << 20):
+    """
+    Controleer de horizonvoorwaarde voor alle n in [start, stop) in blokken.
+
+    Cycluslengtes komen per blok uit de gesegmenteerde zeef van
+    `stream.iter_back_front`; het geheugen blijft O(chunk).  Retourneert
+    (aantal gecontroleerde n, eerste n die faalt of None).
+    """
+    from .stream import iter_back_front
+
+    checked = 0
+    if stop <= start:
+        return checked, None
+    for ns, L, _ in iter_back_front(start, window=min(chunk, stop - start), blocks=True):
+        keep = ns < stop
+        ns, L = ns[keep], L[keep]
+        ok = horizon_bound_array(ns, L)
+        if not ok.all():
+            return checked + int(np.argmin(ok)), int(ns[np.argmin(ok)])
+        checked += len(ns)
+        if checked >= stop - start:
+            return checked, None
@@ -1,58 +1,105 @@
 
 from __future__ import annotations
 import math
+from functools import lru_cache
 from typing import List, Tuple
 
+from . import cache as _cache
+from .factorization import factorint
+
+# Memory-mapped lookup tables by kind ("a003558", "back_front"); see table.attach().
+_TABLES: dict = {}
+
+def _factors(n: int) -> tuple:
+    """((p,e),...) of n; shared through the opt-in "factors" cache."""
+    return _cache.cached("factors", n, lambda: tuple(factorint(n).items()))
+
 def phi(n: int) -> int:
-    """Euler's totient via factorization (simple)."""
+    """Euler's totient via factorization (active factorization backend)."""
     if n <= 0: raise ValueError("n must be positive")
     result = n
-    m = n
-    p = 2
-    while p * p <= m:
-        if m % p == 0:
-            while m % p == 0:
-                m //= p
-            result -= result // p
-        p = 3 if p == 2 else p + 2  # skip evens
-    if m > 1:
-        result -= result // m
+    for p, _ in _factors(n):
+        result -= result // p
     return result
 
-def multiplicative_order(a: int, m: int) -> int:
-    """Smallest k>0 such that a^k ≡ 1 (mod m); assumes gcd(a,m)=1."""
+def multiplicative_order(a: int, m: int, exponent: int | None = None, factors=None) -> int:
+    """
+    Smallest k>0 such that a^k ≡ 1 (mod m); assumes gcd(a,m)=1.
+
+    Starts from a known multiple of the order (`exponent`, default phi(m)) and
+    divides out each prime factor while a^(t/p) ≡ 1 (mod m) still holds, which
+    costs O(Omega(exponent)) modular exponentiations.  `factors` is an optional
+    precomputed factorization [(p,e),...] of the exponent, so batch callers
+    need not factor again.
+    """
     if math.gcd(a, m) != 1:
         raise ValueError("a and m must be coprime")
-    # order divides phi(m): test divisors in increasing order
+    if exponent is None and factors is None:
+        return _cache.cached("multiplicative_order", (a, m), lambda: _order_from_phi(a, m))
+    t = phi(m) if exponent is None else exponent
+    if factors is None:
+        factors = _factors(t)
+    return _pruned_order(a, m, t, factors)
+
+def _order_from_phi(a: int, m: int) -> int:
     t = phi(m)
-    # factor t
-    fac = {}
-    x = t
-    d = 2
-    while d * d <= x:
-        while x % d == 0:
-            fac[d] = fac.get(d, 0) + 1
-            x //= d
-        d = 3 if d == 2 else d + 2
-    if x > 1:
-        fac[x] = fac.get(x, 0) + 1
-    # generate divisors in increasing order
-    divs = [1]
-    for p, e in fac.items():
-        divs = [d * (p ** k) for d in divs for k in range(e + 1)]
-    for d in sorted(divs):
-        if pow(a, d, m) == 1:
-            return d
-    raise RuntimeError("order not found")
+    return _pruned_order(a, m, t, _factors(t))
+
+def _pruned_order(a: int, m: int, t: int, factors) -> int:
+    for p, e in factors:
+        for _ in range(e):
+            if pow(a, t // p, m) != 1:
+                break
+            t //= p
+    return t
+
+def carmichael_lambda(n: int) -> int:
+    """Carmichael function λ(n): exponent of the unit group (Z/nZ)^*."""
+    if n <= 0:
+        raise ValueError("n must be positive")
+    lam = 1
+    for p, e in prime_power_factors(n):
+        if p == 2:
+            part = 1 if e == 1 else 2 if e == 2 else 2 ** (e - 2)
+        else:
+            part = (p - 1) * p ** (e - 1)
+        lam = lam * part // math.gcd(lam, part)
+    return lam
+
+@lru_cache(maxsize=1 << 16)
+def prime_power_order(a: int, p: int, e: int) -> int:
+    """
+    ord_{p^e}(a), memoized on (a, p, e).
+
+    ord_p(a) comes from the pruning algorithm on p-1; each further power
+    either keeps the order or multiplies it by p.
+    """
+    if e == 1:
+        return multiplicative_order(a, p, exponent=p - 1)
+    k = prime_power_order(a, p, e - 1)
+    return k if pow(a, k, p ** e) == 1 else k * p
+
+def order_by_crt(a: int, m: int) -> int:
+    """ord_m(a) as the lcm of ord_{p^e}(a) over the prime powers of m."""
+    if math.gcd(a, m) != 1:
+        raise ValueError("a and m must be coprime")
+    k = 1
+    for p, e in prime_power_factors(m):
+        kp = prime_power_order(a % p ** e, p, e)
+        k = k * kp // math.gcd(k, kp)
+    return k
 
 def a003558_order(n: int) -> int:
     """A003558(n) = ord_{2n+1}(2)."""
     if n < 0:
         raise ValueError("n >= 0 required")
+    table = _TABLES.get("a003558")
+    if table is not None and n in table:
+        return table.get(n)
     m = 2*n + 1
     if m == 1:
         return 1
-    return multiplicative_order(2, m)
+    return _cache.cached("a003558_order", n, lambda: order_by_crt(2, m))
 
 def back_front_cycle_length(n: int) -> int:
     """
@@ -60,24 +107,16 @@ def back_front_cycle_length(n: int) -> int:
     """
     if n <= 0:
         raise ValueError("n must be >=1")
+    table = _TABLES.get("back_front")
+    if table is not None and n in table:
+        return table.get(n)
     m = 2*n - 1
     if m == 1:
         return 1
-    return multiplicative_order(2, m)
+    return order_by_crt(2, m)
 
 def prime_power_factors(n: int):
     """Return prime-power factorization list [(p,e),...]."""
-    out = []
-    m = n
-    p = 2
-    while p * p <= m:
-        if m % p == 0:
-            e = 0
-            while m % p == 0:
-                m //= p
-                e += 1
-            out.append((p,e))
-        p = 3 if p == 2 else p + 2
-    if m > 1:
-        out.append((m,1))
-    return out
+    return list(_factors(n))
+
+_cache.register_clear_hook(prime_power_order.cache_clear)
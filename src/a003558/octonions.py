@@ -94,6 +94,119 @@ def norm(x: np.ndarray) -> float:
     # Euclidean norm coincides with the composition norm here
     return float(np.linalg.norm(x))
 
+# ---------- Scalar fast path (plain sequences, no NumPy temporaries) ----------
+
+def octonion_mul_fast(x, y, out=None, accumulate: bool = False):
+    """
+    Cayley–Dickson product for one pair given as plain length-8 sequences.
+
+    The quaternion products are written out in full on Python floats, so no
+    intermediate arrays are created.  Without `out` a tuple is returned;
+    with a preallocated `out` (list or array) the result is stored there,
+    or added to it when accumulate=True, and `out` is returned.
+    Pass Python floats (e.g. from `.tolist()`); NumPy scalars are slower.
+    """
+    a0, a1, a2, a3, b0, b1, b2, b3 = x
+    c0, c1, c2, c3, d0, d1, d2, d3 = y
+    # left = a*c - conj(d)*b
+    r0 = (a0*c0 - a1*c1 - a2*c2 - a3*c3) - (d0*b0 + d1*b1 + d2*b2 + d3*b3)
+    r1 = (a0*c1 + a1*c0 + a2*c3 - a3*c2) - (d0*b1 - d1*b0 - d2*b3 + d3*b2)
+    r2 = (a0*c2 - a1*c3 + a2*c0 + a3*c1) - (d0*b2 + d1*b3 - d2*b0 - d3*b1)
+    r3 = (a0*c3 + a1*c2 - a2*c1 + a3*c0) - (d0*b3 - d1*b2 + d2*b1 - d3*b0)
+    # right = d*a + b*conj(c)
+    r4 = (d0*a0 - d1*a1 - d2*a2 - d3*a3) + (b0*c0 + b1*c1 + b2*c2 + b3*c3)
+    r5 = (d0*a1 + d1*a0 + d2*a3 - d3*a2) + (b1*c0 - b0*c1 - b2*c3 + b3*c2)
+    r6 = (d0*a2 - d1*a3 + d2*a0 + d3*a1) + (b2*c0 - b0*c2 + b1*c3 - b3*c1)
+    r7 = (d0*a3 + d1*a2 - d2*a1 + d3*a0) + (b3*c0 - b0*c3 - b1*c2 + b2*c1)
+    if out is None:
+        return (r0, r1, r2, r3, r4, r5, r6, r7)
+    if accumulate:
+        out[0] += r0
+        out[1] += r1
+        out[2] += r2
+        out[3] += r3
+        out[4] += r4
+        out[5] += r5
+        out[6] += r6
+        out[7] += r7
+    else:
+        out[0] = r0
+        out[1] = r1
+        out[2] = r2
+        out[3] = r3
+        out[4] = r4
+        out[5] = r5
+        out[6] = r6
+        out[7] = r7
+    return out
+
+def conj_fast(x, out=None):
+    """Octonion conjugate of a plain length-8 sequence (tuple, or into `out`)."""
+    x0, x1, x2, x3, x4, x5, x6, x7 = x
+    if out is None:
+        return (x0, -x1, -x2, -x3, -x4, -x5, -x6, -x7)
+    out[0] = x0
+    out[1] = -x1
+    out[2] = -x2
+    out[3] = -x3
+    out[4] = -x4
+    out[5] = -x5
+    out[6] = -x6
+    out[7] = -x7
+    return out
+
+# ---------- Batched (..., 8) variants ----------
+
+def _q_mul_cols(p0, p1, p2, p3, q0, q1, q2, q3):
+    """Hamilton product on quaternion component columns (broadcasting)."""
+    return (
+        p0*q0 - p1*q1 - p2*q2 - p3*q3,
+        p0*q1 + p1*q0 + p2*q3 - p3*q2,
+        p0*q2 - p1*q3 + p2*q0 + p3*q1,
+        p0*q3 + p1*q2 - p2*q1 + p3*q0,
+    )
+
+def octonion_mul_batch(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Cayley–Dickson product over arrays of shape (..., 8), with broadcasting.
+
+    Same formula as octonion_mul, evaluated on component columns so that a
+    whole batch costs a fixed number of vectorized operations.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if x.shape[-1:] != (8,) or y.shape[-1:] != (8,):
+        raise ValueError("last axis must have length 8")
+    a0, a1, a2, a3, b0, b1, b2, b3 = np.ascontiguousarray(np.moveaxis(x, -1, 0))
+    c0, c1, c2, c3, d0, d1, d2, d3 = np.ascontiguousarray(np.moveaxis(y, -1, 0))
+
+    ac = _q_mul_cols(a0, a1, a2, a3, c0, c1, c2, c3)
+    db = _q_mul_cols(d0, -d1, -d2, -d3, b0, b1, b2, b3)
+    da = _q_mul_cols(d0, d1, d2, d3, a0, a1, a2, a3)
+    bc = _q_mul_cols(b0, b1, b2, b3, c0, -c1, -c2, -c3)
+
+    out = np.empty(np.broadcast_shapes(x.shape, y.shape), dtype=float)
+    for i in range(4):
+        out[..., i] = ac[i] - db[i]
+        out[..., 4 + i] = da[i] + bc[i]
+    return out
+
+def conj_batch(x: np.ndarray) -> np.ndarray:
+    """Octonion conjugate over arrays of shape (..., 8)."""
+    x = np.asarray(x, dtype=float)
+    if x.shape[-1:] != (8,):
+        raise ValueError("last axis must have length 8")
+    out = -x
+    out[..., 0] = x[..., 0]
+    return out
+
+def norm_batch(x: np.ndarray) -> np.ndarray:
+    """Euclidean (composition) norm over the last axis of (..., 8) arrays."""
+    x = np.asarray(x, dtype=float)
+    if x.shape[-1:] != (8,):
+        raise ValueError("last axis must have length 8")
+    return np.sqrt(np.einsum("...i,...i->...", x, x))
+
 def random_unit(seed: int | None = None) -> np.ndarray:
     """
     Random unit octonion (uniform on the 7-sphere).
@@ -103,6 +216,49 @@ def random_unit(seed: int | None = None) -> np.ndarray:
     v /= np.linalg.norm(v)
     return v
 
+def random_units(n: int, rng=None, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    n random unit octonions (uniform on the 7-sphere) as an (n, 8) array.
+
+    `rng` may be a Generator, a seed or a SeedSequence; `out` is an optional
+    preallocated (n, 8) float64 buffer that is filled in place.
+    """
+    rng = np.random.default_rng(rng)
+    if out is None:
+        out = np.empty((n, 8), dtype=float)
+    elif out.shape != (n, 8) or out.dtype != np.float64:
+        raise ValueError("out must be a float64 array of shape (n, 8)")
+    rng.standard_normal(out=out)
+    out /= np.sqrt(np.einsum("ij,ij->i", out, out))[:, None]
+    return out
+
+def iter_random_units(total: int, chunk: int = 1 << 16, rng=None):
+    """
+    Stream `total` random unit octonions in (<=chunk, 8) blocks.
+
+    Memory stays at one chunk: the same buffer is refilled for every block,
+    so copy a block if it must outlive the next iteration.
+    """
+    if chunk <= 0:
+        raise ValueError("chunk must be positive")
+    rng = np.random.default_rng(rng)
+    buf = np.empty((min(chunk, max(total, 0)), 8), dtype=float)
+    done = 0
+    while done < total:
+        k = min(chunk, total - done)
+        yield random_units(k, rng, out=buf[:k])
+        done += k
+
+def spawn_rngs(seed, n_streams: int) -> list[np.random.Generator]:
+    """
+    Independent, reproducible Generators for parallel workers.
+
+    Children of one SeedSequence; worker i gets stream i, so results do not
+    depend on scheduling.
+    """
+    ss = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    return [np.random.default_rng(child) for child in ss.spawn(n_streams)]
+
 # ---------- Optional convenience ----------
 
 def zero() -> np.ndarray:
@@ -123,3 +279,104 @@ def from_scalar_vector(s: float, v: np.ndarray) -> np.ndarray:
 def to_scalar_vector(x: np.ndarray) -> tuple[float, np.ndarray]:
     x = np.asarray(x, dtype=float).reshape(8)
     return float(x[0]), x[1:].copy()
+
+# ---------- Exponential, logarithm, powers, product chains ----------
+
+def _split(x: np.ndarray):
+    """Scalar part, vector part and |vector| of (..., 8) arrays."""
+    x = np.asarray(x, dtype=float)
+    if x.shape[-1:] != (8,):
+        raise ValueError("last axis must have length 8")
+    s = x[..., 0]
+    v = x[..., 1:]
+    r = np.sqrt(np.einsum("...i,...i->...", v, v))
+    return s, v, r
+
+def _unit_vector(v: np.ndarray, r: np.ndarray) -> np.ndarray:
+    """v/|v|, with e1 as direction where the vector part vanishes."""
+    u = np.zeros_like(v)
+    nz = r > 0
+    u[nz] = v[nz] / r[nz][..., None]
+    u[~nz, 0] = 1.0
+    return u
+
+def octonion_exp(x: np.ndarray) -> np.ndarray:
+    """
+    exp(s + v) = e^s (cos|v| + v/|v| sin|v|) for x of shape (..., 8).
+    """
+    s, v, r = _split(x)
+    out = np.empty(np.shape(x), dtype=float)
+    es = np.exp(s)
+    out[..., 0] = es * np.cos(r)
+    out[..., 1:] = (es * np.sinc(r / np.pi))[..., None] * v
+    return out
+
+def octonion_log(x: np.ndarray) -> np.ndarray:
+    """
+    Principal logarithm ln|x| + v/|v| arccos(s/|x|) for nonzero x of shape (..., 8).
+
+    For negative reals the direction e1 is chosen.
+    """
+    s, v, r = _split(x)
+    n = np.hypot(s, r)
+    if np.any(n == 0):
+        raise ValueError("log of zero octonion")
+    out = np.empty(np.shape(x), dtype=float)
+    out[..., 0] = np.log(n)
+    theta = np.arctan2(r, s)
+    out[..., 1:] = _unit_vector(v, r) * theta[..., None]
+    return out
+
+def octonion_pow(x: np.ndarray, t) -> np.ndarray:
+    """
+    x^t = |x|^t (cos tθ + u sin tθ) for real t, with x = |x|(cos θ + u sin θ).
+
+    Powers of one octonion live in the complex plane span{1, u}, so this
+    agrees with repeated multiplication for integer t.
+    """
+    s, v, r = _split(x)
+    t = np.asarray(t, dtype=float)
+    n = np.hypot(s, r)
+    theta = np.arctan2(r, s)
+    shape = np.broadcast_shapes(np.shape(x), t.shape + (8,))
+    out = np.empty(shape, dtype=float)
+    with np.errstate(divide="ignore"):
+        scale = n ** t
+    out[..., 0] = scale * np.cos(t * theta)
+    out[..., 1:] = (scale * np.sin(t * theta))[..., None] * _unit_vector(v, r)
+    return out
+
+def product_chain(xs: np.ndarray, association: str = "left") -> np.ndarray:
+    """
+    Product x_0 x_1 ... x_{K-1} of a chain xs of shape (K, ..., 8).
+
+    Octonions are not associative, so the bracketing must be chosen:
+
+    - "left": (((x_0 x_1) x_2) ...) x_{K-1}, one vectorized multiply per step
+      over all trailing batch axes.
+    - "tree": pairwise tree ((x_0 x_1)(x_2 x_3))..., evaluated level by level
+      with octonion_mul_batch in log2(K) steps.  The left-to-right order of
+      factors is kept, but the result equals "left" only when the factors
+      generate an associative subalgebra (e.g. all clock ticks in span{1, e1},
+      or any two octonions by Artin's theorem).
+    """
+    xs = np.asarray(xs, dtype=float)
+    if xs.ndim < 2 or xs.shape[-1] != 8:
+        raise ValueError("xs must have shape (K, ..., 8)")
+    if xs.shape[0] == 0:
+        return np.broadcast_to(one(), xs.shape[1:]).copy()
+    if association == "left":
+        acc = xs[0]
+        for k in range(1, xs.shape[0]):
+            acc = octonion_mul_batch(acc, xs[k])
+        return acc
+    if association == "tree":
+        level = xs
+        while level.shape[0] > 1:
+            k = level.shape[0] // 2 * 2
+            paired = octonion_mul_batch(level[0:k:2], level[1:k:2])
+            if level.shape[0] > k:
+                paired = np.concatenate([paired, level[k:]], axis=0)
+            level = paired
+        return level[0]
+    raise ValueError("association must be 'left' or 'tree'")
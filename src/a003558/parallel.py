@@ -0,0 +1,145 @@
+"""
+Multi-core range computation on a chunked process pool.
+
+The parent builds the smallest-prime-factor sieve once and places it, together
+with the int64 result buffer, in `multiprocessing.shared_memory`.  Workers map
+both blocks at start-up and write their chunk of results in place, so neither
+the sieve nor the result lists are ever pickled; tasks are just (lo, hi) pairs.
+Results are identical to the serial `batch` functions.
+
+`iter_parallel_range` streams a long range instead: one sieve, one pool, and
+blocks yielded in order with a bounded number in flight, so memory stays
+proportional to the block size rather than to the whole range.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .batch import a003558_range, back_front_range, spf_sieve
+
+_RANGE_FN = {"a003558": a003558_range, "back_front": back_front_range}
+
+# Per-worker state, set by _init_worker.
+_worker: dict = {}
+
+
+def _init_worker(spf_name: str, spf_len: int, spf_dtype: str, kind: str,
+                 out_name: str | None = None, out_len: int = 0, start: int = 0) -> None:
+    spf_shm = shared_memory.SharedMemory(name=spf_name)
+    _worker["shm"] = [spf_shm]
+    _worker["spf"] = np.ndarray(spf_len, dtype=spf_dtype, buffer=spf_shm.buf)
+    _worker["fn"] = _RANGE_FN[kind]
+    if out_name is not None:
+        out_shm = shared_memory.SharedMemory(name=out_name)
+        _worker["shm"].append(out_shm)
+        _worker["out"] = np.ndarray(out_len, dtype=np.int64, buffer=out_shm.buf)
+        _worker["start"] = start
+
+
+def _fill_chunk(bounds: tuple[int, int]) -> int:
+    lo, hi = bounds
+    base = _worker["start"]
+    _worker["out"][lo - base:hi - base] = _worker["fn"](lo, hi, spf=_worker["spf"])
+    return hi - lo
+
+
+def _compute_chunk(bounds: tuple[int, int]) -> tuple[int, np.ndarray]:
+    lo, hi = bounds
+    return lo, _worker["fn"](lo, hi, spf=_worker["spf"])
+
+
+def _to_shared(arr: np.ndarray) -> shared_memory.SharedMemory:
+    shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+    np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[...] = arr
+    return shm
+
+
+def parallel_range(start: int, stop: int, kind: str = "a003558",
+                   workers: int | None = None, chunk: int | None = None) -> np.ndarray:
+    """
+    Values of `kind` ("a003558" or "back_front") for n in [start, stop),
+    computed on `workers` processes (default: all cores) in chunks of `chunk` n.
+    """
+    if kind not in _RANGE_FN:
+        raise ValueError(f"kind must be one of {sorted(_RANGE_FN)}")
+    fn = _RANGE_FN[kind]
+    total = stop - start
+    workers = workers or os.cpu_count() or 1
+    if total <= 0 or workers == 1:
+        return fn(start, max(start, stop))
+    if chunk is None:
+        chunk = max(1 << 14, -(-total // (4 * workers)))
+    spf = spf_sieve(2 * stop + 1)
+    bounds = [(lo, min(stop, lo + chunk)) for lo in range(start, stop, chunk)]
+
+    spf_shm = _to_shared(spf)
+    out_shm = shared_memory.SharedMemory(create=True, size=total * 8)
+    try:
+        initargs = (spf_shm.name, len(spf), spf.dtype.str, kind, out_shm.name, total, start)
+        with ProcessPoolExecutor(max_workers=min(workers, len(bounds)),
+                                 initializer=_init_worker, initargs=initargs) as ex:
+            for _ in ex.map(_fill_chunk, bounds):
+                pass
+        return np.ndarray(total, dtype=np.int64, buffer=out_shm.buf).copy()
+    finally:
+        out_shm.close()
+        out_shm.unlink()
+        spf_shm.close()
+        spf_shm.unlink()
+
+
+def iter_parallel_range(start: int, stop: int, kind: str = "a003558",
+                        workers: int | None = None,
+                        chunk: int = 1 << 20) -> Iterator[tuple[int, np.ndarray]]:
+    """
+    Yield (lo, values) for consecutive blocks [lo, lo + chunk) of [start, stop).
+
+    The sieve for the whole range and the process pool are created once; at
+    most 2 * workers blocks are in flight, and blocks arrive in order.
+    """
+    if kind not in _RANGE_FN:
+        raise ValueError(f"kind must be one of {sorted(_RANGE_FN)}")
+    if chunk <= 0:
+        raise ValueError("chunk must be positive")
+    if stop <= start:
+        return
+    fn = _RANGE_FN[kind]
+    workers = workers or os.cpu_count() or 1
+    spf = spf_sieve(2 * stop + 1)
+    bounds = ((lo, min(stop, lo + chunk)) for lo in range(start, stop, chunk))
+    if workers == 1:
+        for lo, hi in bounds:
+            yield lo, fn(lo, hi, spf=spf)
+        return
+
+    spf_shm = _to_shared(spf)
+    initargs = (spf_shm.name, len(spf), spf.dtype.str, kind)
+    del spf
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=initargs) as ex:
+            pending: deque = deque()
+            for b in bounds:
+                pending.append(ex.submit(_compute_chunk, b))
+                if len(pending) >= 2 * workers:
+                    break
+            try:
+                while pending:
+                    lo, values = pending.popleft().result()
+                    nxt = next(bounds, None)
+                    if nxt is not None:
+                        pending.append(ex.submit(_compute_chunk, nxt))
+                    yield lo, values
+            finally:
+                for fut in pending:
+                    fut.cancel()
+    finally:
+        spf_shm.close()
+        spf_shm.unlink()
@@ -0,0 +1,89 @@
+"""
+Back-front permutation simulator with cycle decomposition.
+
+The back-front shuffle of a deck of 2n-1 cards interleaves the front half
+(n cards) with the back half (n-1 cards): front, back, front, back, ...
+The card at position i moves to 2i mod (2n-1), so the number of shuffles
+that restores the deck is ord_{2n-1}(2) = `back_front_cycle_length(n)`.
+
+Permutations are NumPy index arrays in gather form: one shuffle maps a deck
+to deck[perm], and k shuffles to deck[perm^k].
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from .number_theory import back_front_cycle_length
+
+
+def back_front_permutation(n: int) -> np.ndarray:
+    """Gather index array of the back-front shuffle on 2n-1 cards."""
+    if n <= 0:
+        raise ValueError("n must be >=1")
+    perm = np.empty(2 * n - 1, dtype=np.int64)
+    perm[0::2] = np.arange(n)
+    perm[1::2] = np.arange(n, 2 * n - 1)
+    return perm
+
+
+def cycle_decomposition(perm: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Cycles of a permutation in O(n) with a visited bitmap.
+
+    Returns (orbits, offsets): cycle c consists of orbits[offsets[c]:offsets[c+1]],
+    listed in the order the permutation visits them.
+    """
+    p = np.asarray(perm, dtype=np.int64).tolist()
+    n = len(p)
+    visited = bytearray(n)
+    orbits = []
+    offsets = [0]
+    for start in range(n):
+        if visited[start]:
+            continue
+        j = start
+        while not visited[j]:
+            visited[j] = 1
+            orbits.append(j)
+            j = p[j]
+        offsets.append(len(orbits))
+    return np.array(orbits, dtype=np.int64), np.array(offsets, dtype=np.int64)
+
+
+def cycle_lengths(perm: np.ndarray) -> np.ndarray:
+    """Lengths of all cycles, in the order of cycle_decomposition."""
+    _, offsets = cycle_decomposition(perm)
+    return np.diff(offsets)
+
+
+def permutation_order(perm: np.ndarray) -> int:
+    """Order of the permutation: lcm of its cycle lengths."""
+    return math.lcm(*np.unique(cycle_lengths(perm)).tolist()) if len(perm) else 1
+
+
+def permutation_power(perm: np.ndarray, k: int) -> np.ndarray:
+    """perm^k by repeated squaring: O(n log k)."""
+    if k < 0:
+        raise ValueError("k must be >= 0")
+    base = np.asarray(perm, dtype=np.int64)
+    result = np.arange(len(base), dtype=np.int64)
+    while k:
+        if k & 1:
+            result = result[base]
+        k >>= 1
+        if k:
+            base = base[base]
+    return result
+
+
+def deck_after(n: int, k: int) -> np.ndarray:
+    """Card labels at each position after k back-front shuffles of 2n-1 cards."""
+    return permutation_power(back_front_permutation(n), k)
+
+
+def check_back_front(n: int) -> bool:
+    """Cross-check: simulated cycle length equals back_front_cycle_length(n)."""
+    return permutation_order(back_front_permutation(n)) == back_front_cycle_length(n)
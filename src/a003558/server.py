@@ -0,0 +1,228 @@
+"""
+Optional asyncio lookup server for A003558 / back-front values (JSON lines over TCP).
+
+Each request is one line of JSON, answered by one line in completion order:
+
+    {"id": 1, "kind": "a003558", "n": 12}   ->  {"id": 1, "n": 12, "value": 12}
+    {"kind": "back_front", "n": 5}           ->  {"n": 5, "value": 6}
+    {"op": "stats"}                          ->  {"count": ..., "p50_ms": ..., ...}
+
+Requests that arrive within `window` seconds of each other are coalesced per
+kind into one batch call of the vectorized engine, which runs in a process
+pool so the event loop never blocks on CPU work.  Per-request latencies are
+kept in a bounded ring for percentile reporting.
+
+Run with ``python -m a003558.server --port 8558``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+import numpy as np
+
+from . import number_theory, table
+from .core import a003558_term, back_front_term
+
+_TERM = {"a003558": a003558_term, "back_front": back_front_term}
+_FIRST_N = {"a003558": 0, "back_front": 1}
+
+
+def compute_batch(kind: str, ns: list[int]) -> list[int]:
+    """Values for many n at once through the `core` dispatch (table, sieve or scalar)."""
+    return _TERM[kind](np.asarray(ns, dtype=object)).tolist()
+
+
+def _init_worker(table_paths: tuple[str, ...]) -> None:
+    """Attach the parent's lookup tables in a freshly spawned worker."""
+    for path in table_paths:
+        table.attach(path)
+
+
+class LookupServer:
+    """Line-protocol TCP server with request coalescing and latency stats."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, window: float = 0.002,
+                 max_batch: int = 4096, executor: Executor | None = None,
+                 workers: int | None = None, history: int = 100_000):
+        self.host = host
+        self.port = port
+        self.window = window
+        self.max_batch = max_batch
+        self._own_executor = executor is None
+        # "spawn": forked workers would inherit open client sockets and keep
+        # connections from closing.
+        self._executor = executor or ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(tuple(t.path for t in number_theory._TABLES.values()),))
+        self._pending: dict[str, list[tuple[int, asyncio.Future]]] = {k: [] for k in _TERM}
+        self._flush_handles: dict[str, asyncio.TimerHandle] = {}
+        self._batch_tasks: set[asyncio.Task] = set()
+        self._connections: set[asyncio.Task] = set()
+        self._latencies: deque = deque(maxlen=history)
+        self.batches = 0
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self) -> tuple[str, int]:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.host, self.port = self._server.sockets[0].getsockname()[:2]
+        return self.host, self.port
+
+    async def close(self) -> None:
+        """
+        Stop accepting, fail queued lookups, cancel and await the connection
+        handlers, finish running batches, then stop the pool off-loop.
+        """
+        if self._server is not None:
+            self._server.close()
+        for handle in self._flush_handles.values():
+            handle.cancel()
+        self._flush_handles.clear()
+        for kind in self._pending:
+            queued, self._pending[kind] = self._pending[kind], []
+            for _, fut in queued:
+                if not fut.done():
+                    fut.set_exception(RuntimeError("server is shutting down"))
+        await asyncio.sleep(0)  # let responders write the shutdown errors
+        connections = list(self._connections)
+        for task in connections:
+            task.cancel()
+        if connections:
+            await asyncio.gather(*connections, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+        if self._own_executor:
+            await asyncio.to_thread(self._executor.shutdown, wait=True)
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    # ---------- batching ----------
+
+    def lookup(self, kind: str, n: int) -> asyncio.Future:
+        """Queue one lookup; it is answered with the next batch of its kind."""
+        if kind not in _TERM:
+            raise ValueError(f"kind must be one of {sorted(_TERM)}")
+        if not isinstance(n, int) or isinstance(n, bool) or n < _FIRST_N[kind]:
+            raise ValueError(f"n must be an integer >= {_FIRST_N[kind]}")
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        queue = self._pending[kind]
+        queue.append((n, fut))
+        if len(queue) >= self.max_batch:
+            self._flush(kind)
+        elif kind not in self._flush_handles:
+            self._flush_handles[kind] = loop.call_later(self.window, self._flush, kind)
+        return fut
+
+    def _flush(self, kind: str) -> None:
+        handle = self._flush_handles.pop(kind, None)
+        if handle is not None:
+            handle.cancel()
+        batch, self._pending[kind] = self._pending[kind], []
+        if batch:
+            task = asyncio.ensure_future(self._run_batch(kind, batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, kind: str, batch: list[tuple[int, asyncio.Future]]) -> None:
+        ns = sorted({n for n, _ in batch})
+        loop = asyncio.get_running_loop()
+        self.batches += 1
+        try:
+            values = await loop.run_in_executor(self._executor, compute_batch, kind, ns)
+        except Exception as e:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+        table = dict(zip(ns, values))
+        for n, fut in batch:
+            if not fut.done():
+                fut.set_result(table[n])
+
+    # ---------- latency ----------
+
+    def latency_percentiles(self, qs=(50, 90, 99)) -> dict[str, float]:
+        """Latency percentiles in milliseconds over the recent request history."""
+        out: dict[str, float] = {"count": len(self._latencies), "batches": self.batches}
+        if self._latencies:
+            vals = np.percentile(np.fromiter(self._latencies, dtype=float), qs)
+            out.update({f"p{q}_ms": float(v) * 1e3 for q, v in zip(qs, vals)})
+        return out
+
+    # ---------- protocol ----------
+
+    async def _answer(self, line: bytes) -> dict:
+        t0 = time.perf_counter()
+        reply: dict = {}
+        try:
+            req = json.loads(line)
+            if not isinstance(req, dict):
+                raise ValueError("request must be a JSON object")
+            if "id" in req:
+                reply["id"] = req["id"]
+            if req.get("op") == "stats":
+                reply.update(self.latency_percentiles())
+                return reply
+            n = req.get("n")
+            reply["n"] = n
+            reply["value"] = await self.lookup(req.get("kind", "a003558"), n)
+            self._latencies.append(time.perf_counter() - t0)
+        except Exception as e:
+            reply["error"] = str(e)
+        return reply
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        me = asyncio.current_task()
+        self._connections.add(me)
+        tasks: set[asyncio.Task] = set()
+
+        async def respond(line: bytes) -> None:
+            writer.write(json.dumps(await self._answer(line)).encode() + b"\n")
+            await writer.drain()  # backpressure for pipelining clients
+
+        try:
+            while line := await reader.readline():
+                if line.strip():
+                    task = asyncio.ensure_future(respond(line))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except asyncio.CancelledError:
+            # Only close() cancels handlers; end the connection quietly (the
+            # stream callback would otherwise log the cancellation).
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            self._connections.discard(me)
+            writer.close()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="A003558 JSON-lines lookup server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8558)
+    parser.add_argument("--window", type=float, default=0.002, help="batch window in seconds")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+    server = LookupServer(args.host, args.port, window=args.window, workers=args.workers)
+    asyncio.run(server.serve_forever())
+
+
+if __name__ == "__main__":
+    main()
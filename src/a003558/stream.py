@@ -0,0 +1,154 @@
+"""
+Streaming generators for unbounded A003558 / back-front cycle-length sequences.
+
+The n-axis is processed window by window.  Each window of odd moduli
+m = m0, m0+2, ... is factored by a segmented sieve over the primes up to
+sqrt(max m); λ(m) is then factored by trial division with the same primes and
+the orders are reduced as in `batch`.  Memory is O(window + sqrt(max m)),
+independent of how far the generator runs.
+
+Past moduli of 2^32 (where uint64 products would overflow) the windows fall
+back to the scalar `number_theory.order_by_crt`.  The single-value functions
+in `number_theory` remain the reference implementation.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Iterator
+
+import numpy as np
+
+from .batch import _MAX_MODULUS, _reduce_order, spf_sieve
+from .number_theory import order_by_crt
+
+
+class _Primes:
+    """Odd primes up to a bound that grows (by doubling) on demand."""
+
+    def __init__(self):
+        self.limit = 0
+        self.values = np.zeros(0, dtype=np.int64)
+
+    def upto(self, bound: int) -> np.ndarray:
+        if bound > self.limit:
+            self.limit = max(bound, 2 * self.limit, 1 << 10)
+            spf = spf_sieve(self.limit)
+            idx = np.arange(len(spf))
+            self.values = idx[(spf == idx) & (idx > 2)].astype(np.int64)
+        return self.values[:np.searchsorted(self.values, bound, side="right")]
+
+
+def _carmichael_segment(m0: int, count: int, primes: np.ndarray) -> np.ndarray:
+    """λ(m) for m = m0 + 2j, j < count, via a segmented sieve over odd primes."""
+    m = m0 + 2 * np.arange(count, dtype=np.uint64)
+    rest = m.copy()
+    lam = np.ones(count, dtype=np.uint64)
+    for q in primes.tolist():
+        j0 = (-m0 * ((q + 1) // 2)) % q
+        if j0 >= count:
+            continue
+        idx = np.arange(j0, count, q)
+        uq = np.uint64(q)
+        rest[idx] //= uq
+        part = np.full(len(idx), q - 1, dtype=np.uint64)
+        div = np.flatnonzero(rest[idx] % uq == 0)
+        while len(div):
+            rest[idx[div]] //= uq
+            part[div] *= uq
+            div = div[rest[idx[div]] % uq == 0]
+        lam[idx] = np.lcm(lam[idx], part)
+    big = np.flatnonzero(rest > 1)
+    lam[big] = np.lcm(lam[big], rest[big] - np.uint64(1))
+    return lam
+
+
+def _trial_rounds(t: np.ndarray, primes: np.ndarray):
+    """Factor t by trial division and regroup into `batch._reduce_order` rounds."""
+    rest = t.copy()
+    owners, qs, qes = [], [], []
+    active = np.flatnonzero(rest > 1)
+    for q in [2] + primes.tolist():
+        if len(active) == 0:
+            break
+        uq = np.uint64(q)
+        hit = active[rest[active] % uq == 0]
+        if len(hit):
+            qe = np.ones(len(hit), dtype=np.uint64)
+            div = np.arange(len(hit))
+            while len(div):
+                rest[hit[div]] //= uq
+                qe[div] *= uq
+                div = div[rest[hit[div]] % uq == 0]
+            owners.append(hit)
+            qs.append(np.full(len(hit), q, dtype=np.uint64))
+            qes.append(qe)
+        active = active[rest[active] >= uq * uq]
+    left = np.flatnonzero(rest > 1)
+    owners.append(left)
+    qs.append(rest[left])
+    qes.append(rest[left])
+
+    owner = np.concatenate(owners)
+    q = np.concatenate(qs)
+    qe = np.concatenate(qes)
+    order = np.argsort(owner, kind="stable")
+    owner, q, qe = owner[order], q[order], qe[order]
+    first = np.searchsorted(owner, owner, side="left")
+    rank = np.arange(len(owner)) - first
+    for r in range(int(rank.max()) + 1 if len(rank) else 0):
+        sel = rank == r
+        yield owner[sel], q[sel], qe[sel]
+
+
+def _window_orders(m0: int, count: int, primes: _Primes) -> np.ndarray:
+    """ord_m(2) for the odd moduli m = m0 + 2j, j < count."""
+    m_max = m0 + 2 * (count - 1)
+    if m_max >= _MAX_MODULUS:
+        return np.array([1 if mm == 1 else order_by_crt(2, mm)
+                         for mm in range(m0, m_max + 1, 2)], dtype=np.int64)
+    ps = primes.upto(math.isqrt(m_max))
+    m = m0 + 2 * np.arange(count, dtype=np.uint64)
+    lam = _carmichael_segment(m0, count, ps)
+    return _reduce_order(m, lam, _trial_rounds(lam, ps)).astype(np.int64)
+
+
+def _iter_orders(start: int, offset: int, window: int, blocks: bool) -> Iterator:
+    if window <= 0:
+        raise ValueError("window must be positive")
+    primes = _Primes()
+    n = start
+    while True:
+        m0 = 2 * n + offset
+        L = _window_orders(m0, window, primes)
+        ns = np.arange(n, n + window, dtype=np.int64)
+        ms = 2 * ns + offset
+        if blocks:
+            yield ns, L, ms
+        else:
+            yield from zip(ns.tolist(), L.tolist(), ms.tolist())
+        n += window
+
+
+def iter_a003558(start: int = 0, window: int = 1 << 16, blocks: bool = False) -> Iterator:
+    """
+    Unbounded stream of A003558(n) = ord_{2n+1}(2) from n = start.
+
+    Yields (n, L, m) tuples with m = 2n+1, or with blocks=True one
+    (n, L, m) triple of int64 arrays per window.
+    """
+    if start < 0:
+        raise ValueError("n >= 0 required")
+    return _iter_orders(start, 1, window, blocks)
+
+
+def iter_back_front(start: int = 1, window: int = 1 << 16, blocks: bool = False) -> Iterator:
+    """
+    Unbounded stream of back-front cycle lengths ord_{2n-1}(2) from n = start.
+
+    Yields (n, L, m) tuples with m = 2n-1, or with blocks=True one
+    (n, L, m) triple of int64 arrays per window.
+    """
+    if start <= 0:
+        raise ValueError("n must be >=1")
+    return _iter_orders(start, -1, window, blocks)
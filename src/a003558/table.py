@@ -0,0 +1,160 @@
+"""
+Persistent, memory-mapped lookup tables for A003558 and back-front cycle lengths.
+
+File layout (little-endian):
+
+    64-byte header   magic b"A3558TB1", kind, itemsize, start n, count
+    flat array       count values of uint32 or uint64, value i belongs to n = start + i
+
+Readers open the array with `np.memmap`, so several worker processes share the
+same pages zero-copy.  `build_table` extends an existing file from its last n
+without recomputing earlier entries.  `attach` makes `number_theory` consult a
+table before computing.
+"""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+
+from . import number_theory
+from .batch import a003558_range, back_front_range
+
+MAGIC = b"A3558TB1"
+HEADER_SIZE = 64
+
+KINDS = {"a003558": 0, "back_front": 1}
+_KIND_NAMES = {v: k for k, v in KINDS.items()}
+_FIRST_N = {"a003558": 0, "back_front": 1}
+_RANGE_FN = {"a003558": a003558_range, "back_front": back_front_range}
+
+_HEADER = np.dtype([
+    ("magic", "S8"),
+    ("kind", "<u4"),
+    ("itemsize", "<u4"),
+    ("start", "<u8"),
+    ("count", "<u8"),
+    ("pad", "V32"),
+])
+
+
+def _read_header(path: str) -> np.void:
+    with open(path, "rb") as f:
+        raw = f.read(HEADER_SIZE)
+    if len(raw) != HEADER_SIZE:
+        raise ValueError(f"{path}: truncated table header")
+    hdr = np.frombuffer(raw, dtype=_HEADER)[0]
+    if hdr["magic"] != MAGIC:
+        raise ValueError(f"{path}: not an A003558 table")
+    if int(hdr["kind"]) not in _KIND_NAMES or int(hdr["itemsize"]) not in (4, 8):
+        raise ValueError(f"{path}: unsupported table kind or item size")
+    return hdr
+
+
+def _write_header(f, kind: str, itemsize: int, start: int, count: int) -> None:
+    hdr = np.zeros(1, dtype=_HEADER)
+    hdr["magic"] = MAGIC
+    hdr["kind"] = KINDS[kind]
+    hdr["itemsize"] = itemsize
+    hdr["start"] = start
+    hdr["count"] = count
+    f.seek(0)
+    f.write(hdr.tobytes())
+
+
+class LookupTable:
+    """Read-only memory-mapped view of a table file."""
+
+    def __init__(self, path: str):
+        hdr = _read_header(path)
+        self.path = str(path)
+        self.kind = _KIND_NAMES[int(hdr["kind"])]
+        self.start = int(hdr["start"])
+        self.stop = self.start + int(hdr["count"])
+        dtype = np.dtype("<u4" if int(hdr["itemsize"]) == 4 else "<u8")
+        if self.stop > self.start:
+            self.values = np.memmap(path, dtype=dtype, mode="r", offset=HEADER_SIZE,
+                                    shape=(self.stop - self.start,))
+        else:
+            self.values = np.zeros(0, dtype=dtype)
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __contains__(self, n: int) -> bool:
+        return self.start <= n < self.stop
+
+    def get(self, n: int) -> int | None:
+        """Value for n, or None when n lies outside the covered range."""
+        if n in self:
+            return int(self.values[n - self.start])
+        return None
+
+    def lookup(self, start: int, stop: int) -> np.ndarray:
+        """Values for n in [start, stop) as int64; raises if not fully covered."""
+        if start < self.start or stop > self.stop:
+            raise KeyError(f"[{start}, {stop}) not covered by [{self.start}, {self.stop})")
+        return np.asarray(self.values[start - self.start:stop - self.start], dtype=np.int64)
+
+
+def build_table(path: str, stop: int, kind: str = "a003558", dtype=np.uint32,
+                chunk: int = 1 << 20) -> LookupTable:
+    """
+    Create or extend a table so that it covers n < stop.
+
+    An existing file keeps its entries; only n from its last covered value up
+    to `stop` are computed (in chunks) and appended.  Its header must match
+    the requested `kind` and `dtype`, otherwise ValueError is raised.
+    """
+    if kind not in KINDS:
+        raise ValueError(f"kind must be one of {sorted(KINDS)}")
+    if os.path.exists(path):
+        hdr = _read_header(path)
+        itemsize = int(hdr["itemsize"])
+        file_kind = _KIND_NAMES[int(hdr["kind"])]
+        if file_kind != kind:
+            raise ValueError(f"{path} holds a {file_kind!r} table, not {kind!r}")
+        if itemsize != np.dtype(dtype).itemsize:
+            raise ValueError(f"{path} stores {itemsize}-byte values, "
+                             f"not {np.dtype(dtype).itemsize}-byte {np.dtype(dtype)}")
+        start = int(hdr["start"])
+        count = int(hdr["count"])
+        mode = "r+b"
+    else:
+        itemsize = np.dtype(dtype).itemsize
+        if itemsize not in (4, 8):
+            raise ValueError("dtype must be uint32 or uint64")
+        start = _FIRST_N[kind]
+        count = 0
+        mode = "w+b"
+    out_dtype = np.dtype("<u4" if itemsize == 4 else "<u8")
+    fn = _RANGE_FN[kind]
+    with open(path, mode) as f:
+        if mode == "w+b":
+            _write_header(f, kind, itemsize, start, 0)
+        n = start + count
+        while n < stop:
+            hi = min(stop, n + chunk)
+            f.seek(HEADER_SIZE + count * itemsize)
+            f.write(fn(n, hi).astype(out_dtype).tobytes())
+            count += hi - n
+            n = hi
+        f.truncate(HEADER_SIZE + count * itemsize)
+        _write_header(f, kind, itemsize, start, count)
+    return LookupTable(path)
+
+
+def attach(path: str) -> LookupTable:
+    """Make number_theory look values up in this table before computing."""
+    table = LookupTable(path)
+    number_theory._TABLES[table.kind] = table
+    return table
+
+
+def detach(kind: str | None = None) -> None:
+    """Stop consulting tables (one kind, or all when kind is None)."""
+    if kind is None:
+        number_theory._TABLES.clear()
+    else:
+        number_theory._TABLES.pop(kind, None)
@@ -1,15 +1,42 @@
 from typing import Optional, Iterable, Tuple
 import numpy as np
 
+def decimate_minmax(x: np.ndarray, y: np.ndarray, columns: int):
+    """
+    Min/max per pixelkolom: verdeel de (op x gesorteerde) punten in `columns`
+    aaneengesloten groepen en geef per groep (x-midden, min y, max y).
+
+    Zo blijft elke piek zichtbaar terwijl er hoogstens `columns` kolommen
+    getekend worden, hoe groot n ook is.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=float)
+    if columns <= 0:
+        raise ValueError("columns must be positive")
+    if len(y) <= columns:
+        return x.astype(float), y, y
+    edges = (np.arange(columns + 1, dtype=np.int64) * len(y)) // columns
+    starts = edges[:-1]
+    xc = (x[starts] + x[edges[1:] - 1]) / 2.0
+    return xc, np.minimum.reduceat(y, starts), np.maximum.reduceat(y, starts)
+
+
 def plot_basis(
     n: int = 12,
     save_path: Optional[str] = None,
     show: bool = True,
     title: Optional[str] = None,
+    large: Optional[bool] = None,
+    dpi: int = 150,
 ):
     """
     Plot de eerste n termen van A003558 (voorbeeldvisualisatie).
 
+    Voor grote n (standaard zodra n groter is dan de figuurbreedte in pixels)
+    worden de termen per pixelkolom tot min/max gereduceerd en als gerasterde
+    lagen getekend; de tekentijd en bestandsgrootte blijven dan vrijwel
+    constant in n.
+
     Parameters
     ----------
     n : int, default=12
@@ -20,6 +47,10 @@ def plot_basis(
         Toon de figuur met plt.show().
     title : str | None
         Optionele titel.
+    large : bool | None
+        Forceer (True) of verbied (False) de modus voor grote n; None = automatisch.
+    dpi : int, default=150
+        Resolutie bij opslaan; bepaalt ook het aantal pixelkolommen.
 
     Returns
     -------
@@ -43,10 +74,19 @@ def plot_basis(
             return i
 
     x = np.arange(n, dtype=int)
-    y = np.array([a003558_term(i) for i in x], dtype=float)
+    y = np.asarray(a003558_term(x), dtype=float)
 
     fig, ax = plt.subplots(figsize=(6, 3.6))
-    ax.plot(x, y, "o-", lw=1.5, ms=4)
+    columns = int(fig.get_figwidth() * dpi)
+    if large is None:
+        large = n > columns
+    if large:
+        xc, lo, hi = decimate_minmax(x, y, columns)
+        ax.vlines(xc, lo, hi, lw=0.6, alpha=0.6, rasterized=True)
+        ax.scatter(xc, hi, s=1.5, lw=0, rasterized=True)
+        ax.set_xlim(-0.5, max(n - 0.5, 0.5))
+    else:
+        ax.plot(x, y, "o-", lw=1.5, ms=4)
     ax.set_xlabel("n")
     ax.set_ylabel("a(n)")
     if title:
@@ -54,7 +94,7 @@ def plot_basis(
     ax.grid(True, linestyle="--", alpha=0.35)
 
     if save_path:
-        fig.savefig(save_path, dpi=150)
+        fig.savefig(save_path, dpi=dpi)
     if show:
         plt.show()
     else:
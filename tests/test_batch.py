@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+from a003558.batch import a003558_range, back_front_range, orders_of_two, spf_sieve
+from a003558.number_theory import a003558_order, back_front_cycle_length
+
+def test_spf_sieve_small():
+    spf = spf_sieve(30)
+    assert list(spf[2:16]) == [2,3,2,5,2,7,2,3,2,11,2,13,2,3]
+    assert spf[29] == 29 and spf[25] == 5
+
+def test_a003558_range_matches_scalar():
+    vals = a003558_range(0, 2000)
+    assert vals.dtype == np.int64
+    assert list(vals) == [a003558_order(n) for n in range(2000)]
+
+def test_back_front_range_offset_window():
+    vals = back_front_range(5000, 5400)
+    assert list(vals) == [back_front_cycle_length(n) for n in range(5000, 5400)]
+
+def test_orders_of_two_rejects_even():
+    with pytest.raises(ValueError):
+        orders_of_two([3, 4])
@@ -0,0 +1,19 @@
+import numpy as np
+from a003558.brain import (
+    compression_loss, dyadic_capacity_array, pack_patterns, quenneau_spin_to_dyadic_capacity,
+    spin_batch_stats,
+)
+
+def test_batch_stats_match_scalar():
+    rng = np.random.default_rng(0)
+    pats = [rng.integers(0, 2, rng.integers(0, 40)) for _ in range(300)]
+    packed, offsets = pack_patterns(pats)
+    st = spin_batch_stats(packed, offsets)
+    assert list(st["capacity"]) == [quenneau_spin_to_dyadic_capacity(p) for p in pats]
+    assert np.allclose(st["loss"], [compression_loss(p) for p in pats])
+    assert list(st["popcount"]) == [int(p.sum()) for p in pats]
+    assert np.allclose(st["occupancy"], st["popcount"] / st["capacity"])
+
+def test_capacity_exact_for_large_lengths():
+    n = np.array([2**40, 2**40 + 1, 2**62])
+    assert list(dyadic_capacity_array(n)) == [2**40, 2**41, 2**62]
@@ -0,0 +1,46 @@
+import threading
+import pytest
+from a003558 import cache
+from a003558.cache import LRUCache
+from a003558.number_theory import a003558_order, multiplicative_order, phi, prime_power_factors
+
+def test_lru_and_fifo_eviction():
+    lru = LRUCache(2)
+    lru.put("a", 1); lru.put("b", 2); lru.get("a"); lru.put("c", 3)
+    assert lru.get("b", None) is None and lru.get("a") == 1
+    fifo = LRUCache(2, policy="fifo")
+    fifo.put("a", 1); fifo.put("b", 2); fifo.get("a"); fifo.put("c", 3)
+    assert fifo.get("a", None) is None and fifo.get("b") == 2
+    assert lru.info()["hits"] == 2 and lru.info()["misses"] == 1
+
+def test_shared_factor_cache():
+    cache.enable(maxsize=128)
+    try:
+        prime_power_factors(1728)         # phi(4095) = 1728
+        before = cache.stats()["factors"]["hits"]
+        assert multiplicative_order(2, 4095) == 12
+        assert cache.stats()["factors"]["hits"] > before
+        assert a003558_order(2047) == a003558_order(2047)
+        assert cache.stats()["a003558_order"]["hits"] == 1
+        cache.clear()
+        assert all(s["size"] == 0 and s["hits"] == 0 for s in cache.stats().values())
+    finally:
+        cache.disable()
+    assert cache.stats() == {}
+
+def test_cache_thread_safety():
+    cache.enable(maxsize=64)
+    try:
+        def work():
+            for m in range(3, 400, 2):
+                assert phi(m) > 0
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads: t.start()
+        for t in threads: t.join()
+        assert len(cache.get_cache("factors")) <= 64
+    finally:
+        cache.disable()
+
+def test_enable_rejects_unknown():
+    with pytest.raises(ValueError):
+        cache.enable(names=("nope",))
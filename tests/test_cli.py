@@ -0,0 +1,36 @@
+import pathlib
+import subprocess
+import sys
+import numpy as np
+from a003558.cli import main
+from a003558.number_theory import a003558_order, back_front_cycle_length
+
+def test_range_npy_and_csv(tmp_path: pathlib.Path):
+    out = tmp_path / "a.npy"
+    assert main(["range", "0", "3000", "--format", "npy", "-o", str(out), "--chunk", "700"]) == 0
+    vals = np.load(out)
+    assert vals.shape == (3000,) and vals[1742] == a003558_order(1742)
+    csv = tmp_path / "bf.csv"
+    main(["range", "1", "50", "--kind", "back_front", "-o", str(csv)])
+    lines = csv.read_text().splitlines()
+    assert lines[0] == "n,value" and lines[10] == f"10,{back_front_cycle_length(10)}"
+
+def test_range_workers_streams_blocks(tmp_path: pathlib.Path):
+    out = tmp_path / "w.bin"
+    args = ["range", "0", "20000", "--format", "bin", "-o", str(out), "--chunk", "3000"]
+    assert main(args + ["--workers", "2"]) == 0
+    vals = np.fromfile(out, dtype="<i8")
+    assert vals.shape == (20000,) and vals[19999] == a003558_order(19999)
+
+def test_spikes_and_verify(tmp_path: pathlib.Path, capsys):
+    out = tmp_path / "s.bin"
+    main(["spikes", "1", "100", "--format", "bin", "-o", str(out), "--chunk", "17"])
+    rows = np.fromfile(out, dtype="<i8").reshape(-1, 4)
+    assert [41, 81, 3, 4] in rows.tolist()      # 2*41-1 = 81 = 3^4
+    assert main(["verify-horizon", "5000", "--chunk", "999"]) == 0
+    assert "holds" in capsys.readouterr().out
+
+def test_cli_import_is_light():
+    code = "import sys, a003558.cli; print('numpy' in sys.modules)"
+    res = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert res.stdout.strip() == "False"
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+from a003558.core import a003558_term
+from a003558.number_theory import a003558_order
+
+def test_term_scalar_and_small_array():
+    assert a003558_term(7) == 4
+    assert isinstance(a003558_term(np.int64(7)), int)
+    assert list(a003558_term([0, 1, 2, 3])) == [1, 2, 4, 3]
+
+def test_term_array_shape_and_batch_path():
+    n = np.arange(3000).reshape(30, 100)
+    vals = a003558_term(n)
+    assert vals.shape == (30, 100) and vals.dtype == np.int64
+    assert vals[17, 42] == a003558_order(1742)
+    sparse = a003558_term(np.array([10**12, 5] * 40))
+    assert sparse[1] == a003558_order(5) and sparse[0] == a003558_order(10**12)
+
+def test_term_rejects_negative():
+    with pytest.raises(ValueError):
+        a003558_term(np.array([1, -1]))
+
+def test_back_front_term_matches_scalar():
+    from a003558.core import back_front_term
+    from a003558.number_theory import back_front_cycle_length
+    n = np.arange(1, 2001)
+    expected = [back_front_cycle_length(k) for k in (1, 10, 2000)]
+    assert list(back_front_term(n)[[0, 9, 1999]]) == expected
+    assert back_front_term(10) == 18
+    with pytest.raises(ValueError):
+        back_front_term(np.array([0, 1]))
+
+def test_term_rejects_float_scalars():
+    for bad in (7.9, np.float64(7.0), np.array(7.0)):
+        with pytest.raises(TypeError):
+            a003558_term(bad)
+    assert a003558_term(np.array(7)) == 4
+
+def test_term_wide_integer_inputs():
+    big = [10**20, 3]
+    vals = a003558_term(big)
+    assert vals.dtype == object and vals.tolist() == [a003558_order(10**20), 3]
+    u = np.array([2**63 + 5, 7], dtype=np.uint64)
+    assert a003558_term(u).tolist() == [a003558_order(2**63 + 5), 4]
+    assert a003558_term(np.array([5, 7], dtype=object)).dtype == np.int64
+    with pytest.raises(ValueError):
+        a003558_term(np.array([-10**30, 1], dtype=object))
+    with pytest.raises(TypeError):
+        a003558_term(np.array([1.5, 2], dtype=object))
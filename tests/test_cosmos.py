@@ -0,0 +1,26 @@
+import numpy as np
+from a003558.cosmos import prime_power_spike, prime_power_spike_array
+
+def test_spike_array_matches_scalar():
+    ms = np.arange(-2, 5000)
+    assert list(prime_power_spike_array(ms)) == [prime_power_spike(int(m)) for m in ms]
+
+def test_spike_array_parts():
+    ms = np.array([[243, 45], [2, 7**5]])
+    mask, base, exp = prime_power_spike_array(ms, return_parts=True)
+    assert mask.tolist() == [[True, False], [False, True]]
+    assert base.tolist() == [[3, 0], [0, 7]]
+    assert exp.tolist() == [[5, 0], [0, 5]]
+
+def test_spike_array_caps_sieve():
+    big = 10**12 + 39                       # prime
+    ms = np.array([3**25, big, big * 3, 27, 45])
+    mask, base, exp = prime_power_spike_array(ms, return_parts=True, sieve_limit=1000)
+    assert mask.tolist() == [True, True, False, True, False]
+    assert base.tolist() == [3, big, 0, 3, 0] and exp.tolist() == [25, 1, 0, 3, 0]
+
+def test_spike_array_uint64_above_int64():
+    ms = np.array([9223372036854775837, 3**40, 2**63 + 1, 15], dtype=np.uint64)
+    mask, base, exp = prime_power_spike_array(ms, return_parts=True)
+    assert mask.tolist() == [prime_power_spike(int(m)) for m in ms] == [True, True, False, False]
+    assert base.tolist() == [9223372036854775837, 3, 0, 0] and exp.tolist() == [1, 40, 0, 0]
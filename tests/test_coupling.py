@@ -6,3 +6,12 @@ def test_coupling_is_near_unit():
         for k2 in range(1,8):
             err = coupled_step(k1, k2)
             assert err < 1e-8
+
+def test_coupled_sweep_matches_step():
+    import numpy as np
+    from a003558.coupling import coupled_sweep
+    grid = coupled_sweep(range(1, 8), range(1, 8))
+    assert grid.shape == (7, 7)
+    assert np.allclose(grid, [[coupled_step(a, b) for b in range(1, 8)] for a in range(1, 8)])
+    cube = coupled_sweep([1, 2], [3, 4, 5], phases=np.linspace(0, np.pi, 6))
+    assert cube.shape == (2, 3, 6) and cube.max() < 1e-8
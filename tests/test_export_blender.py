@@ -6,3 +6,137 @@ def test_export_objs(tmp_path: pathlib.Path):
     assert all(pathlib.Path(p).exists() for p in out.values())
     lab = export_label_spheres_obj(path=str(tmp_path / "labels.obj"))
     assert pathlib.Path(lab).exists()
+
+
+def test_obj_writer_offsets_and_solids(tmp_path: pathlib.Path):
+    import numpy as np
+    from a003558.export_blender import ObjWriter, OCTA_FACES, export_solids_obj
+
+    p = tmp_path / "two.obj"
+    with ObjWriter(str(p)) as w:
+        assert w.add_object([[0, 0, 0], [1, 0, 0], [0, 1, 0]], [[0, 1, 2]], name="a") == (0, 3)
+        assert w.add_object([[0, 0, 1], [1, 0, 1], [0, 1, 1]], [[0, 1, 2]], name="b") == (3, 6)
+    lines = p.read_text().splitlines()
+    assert [ln for ln in lines if ln.startswith("f")] == ["f 1 2 3", "f 4 5 6"]
+
+    centers = np.arange(30, dtype=float).reshape(10, 3)
+    q = export_solids_obj(str(tmp_path / "octas.obj"), centers, scale=0.5)
+    text = pathlib.Path(q).read_text().splitlines()
+    verts = np.array([ln.split()[1:] for ln in text if ln.startswith("v ")], dtype=float)
+    faces = np.array([ln.split()[1:] for ln in text if ln.startswith("f ")], dtype=int)
+    assert verts.shape == (60, 3) and faces.shape == (80, 3)
+    assert np.allclose(verts[6:12].mean(axis=0), centers[1])
+    assert (faces[8:16] - 1 == OCTA_FACES + 6).all()
+
+
+def test_binary_ply_and_glb(tmp_path: pathlib.Path):
+    import json
+    import struct
+
+    import numpy as np
+    from a003558.export_blender import FIELD_COLORS, export_glb, export_ply, solid_mesh
+
+    verts, faces, colors = solid_mesh(np.zeros((2, 3)), solid="octa_fields")
+    assert verts.shape == (48, 3) and faces.shape == (16, 3)
+    assert (colors[0] == [0x00, 0xBC, 0xD4]).all() and (colors[45:48] == FIELD_COLORS[7]).all()
+
+    ply = pathlib.Path(export_ply(str(tmp_path / "m.ply"), verts, faces, colors))
+    data = ply.read_bytes()
+    head, body = data.split(b"end_header\n", 1)
+    assert b"binary_little_endian" in head and b"element vertex 48" in head
+    assert len(body) == 48 * 16 + 16 * 13
+    rec = np.frombuffer(body[:48 * 16], dtype=[("xyz", "<f4", 3), ("rgba", "u1", 4)])
+    assert np.allclose(rec["xyz"], verts) and (rec["rgba"][:, :3] == colors).all()
+
+    glb = pathlib.Path(export_glb(str(tmp_path / "m.glb"), verts, faces, colors)).read_bytes()
+    magic, version, total = struct.unpack_from("<III", glb)
+    assert magic == 0x46546C67 and version == 2 and total == len(glb)
+    jlen, _ = struct.unpack_from("<II", glb, 12)
+    gltf = json.loads(glb[20:20 + jlen])
+    bin_start = 20 + jlen + 8
+    view = gltf["bufferViews"][1]
+    idx = np.frombuffer(glb, "<u4", count=faces.size, offset=bin_start + view["byteOffset"])
+    assert (idx.reshape(-1, 3) == faces).all()
+    assert gltf["meshes"][0]["primitives"][0]["attributes"] == {"POSITION": 0, "COLOR_0": 2}
+
+
+def test_instanced_exports(tmp_path: pathlib.Path):
+    import json
+    import struct
+
+    import numpy as np
+    from a003558.export_blender import (
+        OCTA_VERTICES, apply_instances, export_instanced_glb, export_instanced_obj,
+        instance_matrices,
+    )
+
+    t = np.array([[0, 0, 0], [5, 0, 0], [0, 0, 2]], dtype=float)
+    q = np.array([[0, 0, 0, 1], [0, 0, np.sin(np.pi / 4), np.cos(np.pi / 4)], [0, 0, 0, 1]])
+    m = instance_matrices(t, q, scales=[1.0, 2.0, 0.5])
+    placed = apply_instances(OCTA_VERTICES, m)
+    assert np.allclose(placed[1, 0], [5, 2, 0], atol=1e-6)  # (1,0,0) -> 90° om z, x2
+    assert np.allclose(placed[2, 4], [0, 0, 2.5])
+
+    obj, npy = export_instanced_obj(str(tmp_path / "clock.obj"), t, q, [1.0, 2.0, 0.5])
+    assert np.allclose(np.load(npy), m)
+    lines = pathlib.Path(obj).read_text().splitlines()
+    assert sum(ln.startswith("v ") for ln in lines) == 6
+
+    small = export_instanced_glb(str(tmp_path / "s.glb"), np.zeros((10, 3)))
+    big = export_instanced_glb(str(tmp_path / "b.glb"), np.zeros((1000, 3)))
+    grow = pathlib.Path(big).stat().st_size - pathlib.Path(small).stat().st_size
+    assert grow <= 990 * 40 + 64  # 40 bytes per instance (T + R + S float32)
+    data = pathlib.Path(big).read_bytes()
+    jlen, _ = struct.unpack_from("<II", data, 12)
+    gltf = json.loads(data[20:20 + jlen])
+    ext = gltf["nodes"][0]["extensions"]["EXT_mesh_gpu_instancing"]["attributes"]
+    assert gltf["accessors"][ext["ROTATION"]]["count"] == 1000
+
+
+def test_label_spheres_lod_and_index(tmp_path: pathlib.Path):
+    import numpy as np
+    from a003558.export_blender import export_label_spheres_obj, icosphere, sphere_mesh
+
+    assert [len(icosphere(k)[0]) for k in range(3)] == [12, 42, 162]
+    v, f = sphere_mesh(1, kind="uv")
+    assert np.allclose(np.linalg.norm(v, axis=1), 1) and f.max() == len(v) - 1
+
+    pos = np.array([[0, 0, 0], [10, 0, 0], [0, 10, 0]], dtype=float)
+    out, index = export_label_spheres_obj(
+        path=str(tmp_path / "l.obj"), labels=["a", "b c", "d"], positions=pos,
+        radius=0.5, lod=1, return_index=True)
+    lines = pathlib.Path(out).read_text().splitlines()
+    assert [ln for ln in lines if ln.startswith("o ")] == ["o a", "o b c", "o d"]
+    verts = np.array([ln.split()[1:] for ln in lines if ln.startswith("v ")], dtype=float)
+    faces = np.array([ln.split()[1:] for ln in lines if ln.startswith("f ")], dtype=int)
+    assert index == [("a", 0, 42), ("b c", 42, 84), ("d", 84, 126)]
+    _, start, stop = index[1]
+    assert np.allclose(np.linalg.norm(verts[start:stop] - pos[1], axis=1), 0.5, atol=1e-4)
+    assert faces.shape == (240, 3) and faces.min() == 1 and faces.max() == 126
+
+
+def test_obj_precision_at_large_coordinates(tmp_path: pathlib.Path):
+    import numpy as np
+    from a003558.export_blender import OCTA_VERTICES, export_label_spheres_obj, export_solids_obj
+
+    centers = np.array([[123456, 0, 0], [123457, 0, 0], [1e6, -2e5, 3e5]], dtype=float)
+    p = export_solids_obj(str(tmp_path / "far.obj"), centers, scale=0.5)
+    lines = pathlib.Path(p).read_text().splitlines()
+    verts = np.array([ln.split()[1:] for ln in lines if ln.startswith("v ")], dtype=float)
+    expected = (OCTA_VERTICES[None] * 0.5 + centers[:, None]).reshape(-1, 3)
+    assert np.allclose(verts, expected, rtol=0, atol=1e-6)
+
+    out, index = export_label_spheres_obj(
+        path=str(tmp_path / "l.obj"), labels=["far"], positions=[[2e5, 1e5, 0]],
+        radius=0.15, return_index=True)
+    lines = pathlib.Path(out).read_text().splitlines()
+    verts = np.array([ln.split()[1:] for ln in lines if ln.startswith("v ")], dtype=float)
+    assert np.allclose(np.linalg.norm(verts - [2e5, 1e5, 0], axis=1), 0.15, atol=1e-5)
+
+
+def test_label_index_keeps_duplicates(tmp_path: pathlib.Path):
+    from a003558.export_blender import export_label_spheres_obj
+
+    _, index = export_label_spheres_obj(
+        path=str(tmp_path / "d.obj"), labels=["x", "x", "x ", "100%"], lod=0, return_index=True)
+    assert index == [("x", 0, 12), ("x", 12, 24), ("x", 24, 36), ("100%", 36, 48)]
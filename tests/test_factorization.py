@@ -0,0 +1,42 @@
+import math
+import pytest
+from a003558 import factorization
+from a003558.factorization import factorint, is_probable_prime, set_backend, trial_factor
+from a003558.number_theory import a003558_order, phi, prime_power_factors
+from a003558.cosmos import prime_power_spike
+
+def test_backends_agree_small():
+    for n in range(1, 3000):
+        assert factorint(n) == (trial_factor(n) if n > 1 else {})
+
+def test_miller_rabin_known():
+    assert is_probable_prime(2**61 - 1)
+    assert not is_probable_prime(3215031751)  # strong pseudoprime to bases 2,3,5,7
+    assert not is_probable_prime((2**31 - 1) * (2**61 - 1))
+
+def test_large_semiprime_and_prime_power():
+    p, q = 1000000007, 998244353
+    assert factorint(p * q * 3**4) == {3: 4, q: 1, p: 1}
+    assert prime_power_factors(p**3) == [(p, 3)]
+    assert prime_power_spike(p**2) and not prime_power_spike(2 * p)
+    assert phi(p * q) == (p - 1) * (q - 1)
+
+def test_a003558_order_large_n():
+    n = 10**18 + 3
+    k = a003558_order(n)
+    m = 2*n + 1
+    assert pow(2, k, m) == 1
+    for r in factorint(k):
+        assert pow(2, k // r, m) != 1
+
+def test_set_backend_roundtrip():
+    try:
+        set_backend("trial")
+        assert factorization.get_backend() is trial_factor
+        assert phi(97 * 89) == 96 * 88
+        set_backend(lambda n: {n: 1})
+        assert prime_power_factors(15) == [(15, 1)]
+        with pytest.raises(ValueError):
+            set_backend("nope")
+    finally:
+        set_backend("rho")
@@ -17,3 +17,24 @@ def test_staircase_level():
     assert staircase_level(2)==2
     assert staircase_level(3)==2
     assert staircase_level(4)==3
+
+def test_horizon_arrays_exact():
+    import numpy as np
+    from a003558.batch import back_front_range
+    from a003558.horizons import horizon_bound_array, staircase_level_array, verify_horizon
+    n = np.arange(1, 5000)
+    assert horizon_bound_array(n, back_front_range(1, 5000)).all()
+    assert list(staircase_level_array([1, 2, 3, 4, 2**63])) == [1, 2, 2, 3, 64]
+    big = np.array([2**70, 2**70 + 1], dtype=object)
+    assert list(staircase_level_array(big)) == [71, 71]
+    # float log2 rondt 2**53+1 af naar 2**53; integer-versie niet
+    assert not horizon_bound(2**53 + 1, 54) and horizon_bound(2**53, 54)
+    edge = np.array([2**53, 2**53 + 1], dtype=np.uint64)
+    assert list(horizon_bound_array(edge, 54)) == [True, False]
+    assert verify_horizon(20000, chunk=3000) == (19999, None)
+
+
+def test_horizon_bound_numpy_scalars():
+    import numpy as np
+    assert horizon_bound(np.int64(5), 4) and not horizon_bound(np.int64(5), 3)
+    assert all(horizon_bound(n, 1 + int(n - 1).bit_length()) for n in np.arange(1, 100))
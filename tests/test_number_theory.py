@@ -1,6 +1,9 @@
 
 import math
-from a003558.number_theory import a003558_order, back_front_cycle_length, multiplicative_order, phi
+from a003558.number_theory import (
+    a003558_order, back_front_cycle_length, carmichael_lambda, multiplicative_order,
+    order_by_crt, phi,
+)
 
 def test_a003558_small():
     known = [1,2,4,3,6,10,12,4,8]
@@ -20,3 +23,33 @@ def test_order_divides_phi():
         if math.gcd(2,m)==1:
             k = multiplicative_order(2, m)
             assert phi(m) % k == 0
+
+def test_order_with_precomputed_factorization():
+    # phi(4095) = 1728 = 2^6 * 3^3; ord_4095(2) = 12
+    assert multiplicative_order(2, 4095, exponent=1728, factors=[(2,6),(3,3)]) == 12
+    assert multiplicative_order(2, 1) == 1
+    assert multiplicative_order(10, 49) == 42
+
+def test_carmichael_lambda_known():
+    # OEIS A002322
+    known = [1,1,2,2,4,2,6,2,6,4,10,2,12,6,4,4,16,6,18,4]
+    assert [carmichael_lambda(n) for n in range(1,21)] == known
+
+def test_order_by_crt_matches_direct():
+    for m in range(3, 3000, 2):
+        k = order_by_crt(2, m)
+        assert k == multiplicative_order(2, m)
+        assert carmichael_lambda(m) % k == 0
+
+def test_order_factors_modulus_once():
+    from a003558.factorization import get_backend, set_backend
+    m = 1000000000039 * 1000000000061          # 24-digit semiprime
+    previous = get_backend()
+    calls = []
+    set_backend(lambda n: calls.append(n) or previous(n))
+    try:
+        k = multiplicative_order(2, m)
+    finally:
+        set_backend(previous)
+    assert calls.count(m) == 1
+    assert pow(2, k, m) == 1
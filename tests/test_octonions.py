@@ -1,6 +1,8 @@
 
 import numpy as np
-from a003558.octonions import octonion_mul, random_unit, norm
+from a003558.octonions import (
+    conj, conj_batch, norm, norm_batch, octonion_mul, octonion_mul_batch, random_unit,
+)
 
 def test_alternativity_numeric():
     for _ in range(10):
@@ -16,3 +18,65 @@ def test_norm_multiplicative_numeric():
         x = random_unit(None); y = random_unit(None)
         xy = octonion_mul(x,y)
         assert np.isclose(norm(xy), norm(x)*norm(y), atol=1e-8)
+
+def test_batch_matches_reference():
+    rng = np.random.default_rng(3)
+    X = rng.normal(size=(50, 8)); Y = rng.normal(size=(50, 8))
+    Z = octonion_mul_batch(X, Y)
+    assert np.allclose(Z, [octonion_mul(x, y) for x, y in zip(X, Y)], rtol=0, atol=1e-12)
+    assert np.allclose(conj_batch(X), [conj(x) for x in X])
+    assert np.allclose(norm_batch(Z), norm_batch(X) * norm_batch(Y))
+
+def test_batch_broadcasting():
+    rng = np.random.default_rng(4)
+    X = rng.normal(size=(4, 1, 8)); Y = rng.normal(size=(3, 8))
+    Z = octonion_mul_batch(X, Y)
+    assert Z.shape == (4, 3, 8)
+    assert np.allclose(Z[2, 1], octonion_mul(X[2, 0], Y[1]))
+
+def test_fast_scalar_path():
+    from a003558.octonions import conj_fast, octonion_mul_fast
+    rng = np.random.default_rng(5)
+    x = rng.normal(size=8).tolist(); y = rng.normal(size=8).tolist()
+    ref = octonion_mul(x, y)
+    assert np.allclose(octonion_mul_fast(x, y), ref, atol=1e-13)
+    out = np.ones(8)
+    octonion_mul_fast(x, y, out=out, accumulate=True)
+    assert np.allclose(out, ref + 1.0, atol=1e-13)
+    buf = [0.0] * 8
+    assert conj_fast(x, out=buf) is buf and np.allclose(buf, conj(x))
+
+def test_exp_log_pow_roundtrip():
+    from a003558.octonions import octonion_exp, octonion_log, octonion_pow
+    rng = np.random.default_rng(6)
+    X = rng.normal(size=(20, 8))
+    assert np.allclose(octonion_exp(octonion_log(X)), X)
+    cube = octonion_mul_batch(octonion_mul_batch(X, X), X)
+    assert np.allclose(octonion_pow(X, 3), cube)
+    half = octonion_pow(X, 0.5)
+    assert np.allclose(octonion_mul_batch(half, half), X)
+
+def test_product_chain_associations():
+    from a003558.coupling import dyadic_clock_to_octonion
+    from a003558.octonions import product_chain
+    rng = np.random.default_rng(7)
+    X = rng.normal(size=(7, 8))
+    ref = X[0]
+    for x in X[1:]:
+        ref = octonion_mul(ref, x)
+    assert np.allclose(product_chain(X), ref)
+    # klok-tikken liggen in span{1, e1}: daar is de boom-reductie exact
+    ticks = np.array([dyadic_clock_to_octonion(k % 5 + 1, 0.1 * k) for k in range(257)])
+    assert np.allclose(product_chain(ticks, "tree"), product_chain(ticks, "left"))
+
+def test_random_units_batch_and_streams():
+    from a003558.octonions import iter_random_units, random_units, spawn_rngs
+    U = random_units(1000, rng=11)
+    assert U.shape == (1000, 8) and np.allclose(norm_batch(U), 1.0)
+    blocks = [b.copy() for b in iter_random_units(1000, chunk=300, rng=11)]
+    assert [len(b) for b in blocks] == [300, 300, 300, 100]
+    assert np.array_equal(np.concatenate(blocks), U)
+    a = [random_units(5, g) for g in spawn_rngs(42, 3)]
+    b = [random_units(5, g) for g in spawn_rngs(42, 3)]
+    assert all(np.array_equal(x, y) for x, y in zip(a, b))
+    assert not np.allclose(a[0], a[1])
@@ -0,0 +1,17 @@
+import numpy as np
+from a003558.batch import a003558_range, back_front_range
+from a003558.parallel import parallel_range
+
+def test_parallel_matches_serial():
+    par = parallel_range(0, 40000, workers=2, chunk=7000)
+    assert np.array_equal(par, a003558_range(0, 40000))
+
+def test_parallel_back_front_single_worker():
+    par = parallel_range(1, 3000, kind="back_front", workers=1)
+    assert np.array_equal(par, back_front_range(1, 3000))
+
+def test_iter_parallel_range_streams_in_order():
+    from a003558.parallel import iter_parallel_range
+    blocks = list(iter_parallel_range(5, 30005, kind="back_front", workers=2, chunk=4000))
+    assert [lo for lo, _ in blocks] == list(range(5, 30005, 4000))
+    assert np.array_equal(np.concatenate([v for _, v in blocks]), back_front_range(5, 30005))
@@ -0,0 +1,27 @@
+import numpy as np
+from a003558.number_theory import back_front_cycle_length
+from a003558.permutation import (
+    back_front_permutation, check_back_front, cycle_decomposition, deck_after,
+    permutation_order, permutation_power,
+)
+
+def test_back_front_matches_order():
+    assert all(check_back_front(n) for n in range(1, 300))
+
+def test_cycles_and_orbits():
+    perm = back_front_permutation(4)  # 7 kaarten: i -> 2i mod 7
+    assert list(perm) == [0, 4, 1, 5, 2, 6, 3]
+    orbits, offsets = cycle_decomposition(perm)
+    cycles = [sorted(orbits[a:b].tolist()) for a, b in zip(offsets, offsets[1:])]
+    assert sorted(cycles) == [[0], [1, 2, 4], [3, 5, 6]]
+
+def test_power_by_squaring():
+    n = 1000
+    perm = back_front_permutation(n)
+    L = back_front_cycle_length(n)
+    assert np.array_equal(deck_after(n, L), np.arange(2*n - 1))
+    step = np.arange(2*n - 1)
+    for _ in range(13):
+        step = step[perm]
+    assert np.array_equal(permutation_power(perm, 13), step)
+    assert permutation_order(permutation_power(perm, 2)) == L // np.gcd(L, 2)
@@ -0,0 +1,80 @@
+import asyncio
+import json
+from a003558.number_theory import a003558_order, back_front_cycle_length
+from a003558.server import LookupServer
+
+async def _roundtrip(port, requests):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for req in requests:
+        writer.write(json.dumps(req).encode() + b"\n")
+    await writer.drain()
+    writer.write_eof()
+    replies = [json.loads(line) async for line in reader]
+    writer.close()
+    return replies
+
+def test_server_batches_and_answers():
+    async def scenario():
+        server = LookupServer(window=0.05, workers=1)
+        _, port = await server.start()
+        try:
+            reqs = [{"id": i, "n": i} for i in range(200)]
+            reqs += [{"id": "bf", "kind": "back_front", "n": 10**6}, {"id": "bad", "n": -1}]
+            replies = await _roundtrip(port, reqs)
+            stats = (await _roundtrip(port, [{"op": "stats"}]))[0]
+        finally:
+            await server.close()
+        return server, replies, stats
+
+    server, replies, stats = asyncio.run(scenario())
+    by_id = {r["id"]: r for r in replies}
+    assert all(by_id[i]["value"] == a003558_order(i) for i in range(200))
+    assert by_id["bf"]["value"] == back_front_cycle_length(10**6)
+    assert "error" in by_id["bad"]
+    assert server.batches <= 3
+    assert stats["count"] == 201 and stats["p50_ms"] <= stats["p99_ms"]
+
+def test_compute_batch_uses_attached_table(tmp_path):
+    import numpy as np
+    from a003558.server import compute_batch
+    from a003558.table import attach, build_table, detach
+    path = str(tmp_path / "bf.tbl")
+    build_table(path, 100, kind="back_front")
+    try:
+        t = attach(path)
+        t.values = np.array(t.values)
+        t.values[9] = 777
+        assert compute_batch("back_front", [10, 11]) == [777, back_front_cycle_length(11)]
+    finally:
+        detach()
+    assert compute_batch("a003558", [2**70, 3]) == [a003558_order(2**70), a003558_order(3)]
+
+def test_close_fails_queued_lookups():
+    async def scenario():
+        server = LookupServer(window=10.0, workers=1)
+        await server.start()
+        fut = server.lookup("a003558", 12)
+        await server.close()
+        return fut
+
+    fut = asyncio.run(scenario())
+    assert isinstance(fut.exception(), RuntimeError)
+
+def test_close_with_connected_client(caplog):
+    async def scenario():
+        server = LookupServer(window=10.0, workers=1)
+        _, port = await server.start()
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b'{"id": 1, "n": 12}\n')
+        await writer.drain()
+        await asyncio.sleep(0.05)
+        await asyncio.wait_for(server.close(), 30)
+        reply = json.loads(await reader.readline())
+        eof = await reader.read()
+        writer.close()
+        return server, reply, eof
+
+    server, reply, eof = asyncio.run(scenario())
+    assert reply["error"] == "server is shutting down" and eof == b""
+    assert not server._connections
+    assert not [r for r in caplog.records if r.name == "asyncio"]
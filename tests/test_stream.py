@@ -0,0 +1,19 @@
+import itertools
+import numpy as np
+from a003558.number_theory import a003558_order, back_front_cycle_length
+from a003558.stream import iter_a003558, iter_back_front
+
+def test_iter_a003558_tuples_cross_windows():
+    got = list(itertools.islice(iter_a003558(0, window=97), 600))
+    assert got[:3] == [(0, 1, 1), (1, 2, 3), (2, 4, 5)]
+    assert [L for _, L, _ in got] == [a003558_order(n) for n in range(600)]
+
+def test_iter_back_front_blocks():
+    ns, L, ms = next(iter_back_front(123456, window=512, blocks=True))
+    assert ns[0] == 123456 and len(L) == 512
+    assert np.array_equal(ms, 2*ns - 1)
+    assert list(L[::37]) == [back_front_cycle_length(int(n)) for n in ns[::37]]
+
+def test_iter_beyond_uint32_moduli():
+    n, L, m = next(iter_a003558(2**31, window=4))
+    assert m == 2**32 + 1 and L == 64
@@ -0,0 +1,41 @@
+import pathlib
+import numpy as np
+from a003558 import number_theory
+from a003558.number_theory import a003558_order, back_front_cycle_length
+from a003558.table import LookupTable, attach, build_table, detach
+
+def test_build_and_extend(tmp_path: pathlib.Path):
+    path = str(tmp_path / "a.tbl")
+    t = build_table(path, 500)
+    assert (t.start, t.stop, t.kind) == (0, 500, "a003558")
+    assert list(t.lookup(0, 500)) == [a003558_order(n) for n in range(500)]
+    size = pathlib.Path(path).stat().st_size
+    t2 = build_table(path, 1200, chunk=256)
+    assert pathlib.Path(path).stat().st_size == size + 700 * 4
+    assert list(t2.lookup(480, 1200)) == [a003558_order(n) for n in range(480, 1200)]
+    assert isinstance(t2.values, np.memmap)
+
+def test_attach_consults_table(tmp_path: pathlib.Path):
+    path = str(tmp_path / "bf.tbl")
+    build_table(path, 100, kind="back_front", dtype=np.uint64)
+    try:
+        table = attach(path)
+        # overschrijf een waarde: de tabel moet eerst geraadpleegd worden
+        table.values = np.array(table.values)
+        table.values[9] = 12345
+        assert back_front_cycle_length(10) == 12345
+        assert back_front_cycle_length(150) == number_theory.order_by_crt(2, 299)
+    finally:
+        detach()
+    assert back_front_cycle_length(10) == 18
+    assert LookupTable(path).get(1000) is None
+
+def test_extend_rejects_mismatched_header(tmp_path: pathlib.Path):
+    import pytest
+    path = str(tmp_path / "a.tbl")
+    build_table(path, 200)
+    with pytest.raises(ValueError):
+        build_table(path, 300, kind="back_front")
+    with pytest.raises(ValueError):
+        build_table(path, 300, dtype=np.uint64)
+    assert LookupTable(path).stop == 200
@@ -19,3 +19,21 @@ def test_plot_octahedron_smoke(tmp_path: pathlib.Path):
     fig = plot_octahedron(save_path=str(out_png), show=False, title="Octa Test")
     assert out_png.exists()
     assert fig is not None
+
+
+def test_decimate_minmax_and_large_basis(tmp_path: pathlib.Path):
+    """Grote n: min/max per pixelkolom behoudt pieken, lagen zijn gerasterd."""
+    import numpy as np
+    from a003558.viz import decimate_minmax, plot_basis
+
+    y = np.zeros(1000)
+    y[537] = 9.0
+    xc, lo, hi = decimate_minmax(np.arange(1000), y, 10)
+    assert len(xc) == 10 and hi.max() == 9.0 and hi[5] == 9.0 and lo.max() == 0.0
+
+    out = tmp_path / "basis.svg"
+    fig = plot_basis(n=20_000, save_path=str(out), show=False)
+    ax = fig.axes[0]
+    assert ax.collections and all(c.get_rasterized() for c in ax.collections)
+    assert not ax.lines
+    assert out.exists()